@@ -0,0 +1,263 @@
+"""
+3D L-System Presets
+
+Trees with leaves, ABOP Fig 2.7/2.8 reproductions and stochastic trees.
+Loaded by lsystem.presets on first use; import PRESETS_3D from there.
+"""
+
+from typing import Dict, Any
+
+from lsystem.presets import (
+    _LEAF_HEX, _LEAF_HEX_UP, _LEAF_NEEDLE, _LEAF_QUAD,
+    _TROPISM_DOWN, _TROPISM_WINDSWEPT,
+)
+
+
+# The gravity comparison trees differ only in tropism strength, so the
+# variants are merged from one base and share its rules dict
+_GRAVITY_BASE = {
+    "axiom": "!(1)F(200)A",
+    "rules": {
+        "A": "!(0.85)F(80)[&(25)$B][/(137.5)&(25)$B][/(275)&(25)$B]/(45)A",
+        "B": "!(0.75)F(60)[+(30)$C][-(30)$C]/(137.5)B",
+        "C": "!(0.65)F(40)L",
+        "L": _LEAF_HEX
+    },
+    "angle": 30,
+    "iterations": 5,
+    "is_3d": True,
+    "render_polygons": True,
+    "tropism_direction": _TROPISM_DOWN,
+    "growth_mode": "sigmoid",
+}
+
+
+def _make_sympodial(a1, a2, tropism_strength, description, leaf=False):
+    """Build an ABOP 2.7 sympodial preset with branch angles a1 and a2."""
+    bud = "$BL" if leaf else "$B"
+    return {
+        "axiom": "!(1)F(200)A",
+        "rules": {
+            "A": f"!(0.707)F(50)[&({a1}){bud}][/(180)&({a2}){bud}]",
+            "B": f"!(0.707)F(45)[&({a1}){bud}][/(180)&({a2}){bud}]",
+            "L": _LEAF_HEX
+        },
+        "angle": 35,
+        "iterations": 10,
+        "is_3d": True,
+        "render_polygons": leaf,
+        "tropism_strength": tropism_strength,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": description,
+    }
+
+
+PRESETS_3D: Dict[str, Dict[str, Any]] = {
+    # =========================================================================
+    # ABOP 3D - THE BEST!
+    # =========================================================================
+    "abop_1_25": {
+        "axiom": "A",
+        "rules": {
+            "A": "[&FLA]/////'[&FLA]/////'[&FLA]",
+            "F": "S/////F",
+            "S": "FL",
+            "L": _LEAF_HEX_UP
+        },
+        "angle": 22.5,
+        "iterations": 8,
+        "is_3d": True,
+        "render_polygons": True,
+        "width_decay": 0.9,
+        "growth_mode": "sigmoid",
+        "description": "ABOP 1.25 - Bush with hexagonal leaves - THE BEST [BEST]"
+    },
+
+    "abop_1_26": {
+        "axiom": "A",
+        "rules": {
+            "A": "[&FPLA]/////'[&FPLA]/////'[&FPLA]",
+            "P": "F[++L][--L]",
+            "L": _LEAF_QUAD,
+            "F": "FF"
+        },
+        "angle": 18,
+        "iterations": 6,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "ABOP 1.26 - Flowering plant with petals"
+    },
+
+    # =========================================================================
+    # Tropism Demo
+    # =========================================================================
+    "tree_gravity_0_none": {
+        **_GRAVITY_BASE,
+        "tropism_strength": 0.0,
+        "description": "Tropism comparison - NO gravity (0.0)"
+    },
+
+    "tree_gravity_1_moderate": {
+        **_GRAVITY_BASE,
+        "tropism_strength": 0.15,
+        "description": "Tropism comparison - MODERATE gravity (0.15)"
+    },
+
+    "tree_gravity_2_strong": {
+        **_GRAVITY_BASE,
+        "tropism_strength": 0.35,
+        "description": "Tropism comparison - STRONG gravity (0.35) [BEST]"
+    },
+
+    # =========================================================================
+    # ABOP Figure 2.7 - Sympodial Trees (Aono & Kunii)
+    # Research-validated parameters from Table 2.2
+    # Uses Leonardo's rule: width_decay = 0.707 (sqrt(2)^-1)
+    # =========================================================================
+    "sympodial_2_7a": _make_sympodial(
+        5, 65, 0.08, "ABOP 2.7a - Tight main branch (a1=5, a2=65)"),
+    "sympodial_2_7b": _make_sympodial(
+        10, 60, 0.10, "ABOP 2.7b - Moderate spread (a1=10, a2=60)"),
+    "sympodial_2_7c": _make_sympodial(
+        20, 50, 0.12, "ABOP 2.7c - Balanced crown (a1=20, a2=50)"),
+    "sympodial_2_7d": _make_sympodial(
+        35, 35, 0.14, "ABOP 2.7d - SYMMETRIC (a1=a2=35) [BEST]", leaf=True),
+
+    # =========================================================================
+    # ABOP Figure 2.8 - Ternary Branching Trees
+    # Research-validated parameters from Table 2.3
+    # Uses da Vinci's rule: width_decay = 1.732 (sqrt(3)) for ternary
+    # =========================================================================
+    "ternary_2_8a": {
+        "axiom": "!(1)F(200)/(45)A",
+        "rules": {
+            "A": "!(1.732)F(50)[&(19)$B]/(94.74)[&(19)$B]/(132.63)[&(19)$B]",
+            "B": "!(1.732)F(45)[&(19)$B]/(94.74)[&(19)$B]/(132.63)[&(19)$B]",
+            "L": _LEAF_HEX
+        },
+        "angle": 20,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "tropism_strength": 0.22,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": "ABOP 2.8a - Conifer angles (d1=94.74, d2=132.63)"
+    },
+
+    "ternary_2_8b": {
+        "axiom": "!(1)F(200)/(45)A",
+        "rules": {
+            "A": "!(1.732)F(50)[&(22)$BL]/(137.5)[&(22)$BL]/(137.5)[&(22)$BL]",
+            "B": "!(1.732)F(45)[&(22)$BL]/(137.5)[&(22)$BL]/(137.5)[&(22)$BL]",
+            "L": _LEAF_HEX
+        },
+        "angle": 20,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": True,
+        "tropism_strength": 0.14,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": "ABOP 2.8b - Golden angle whorls (137.5) [BEST]"
+    },
+
+    "ternary_2_8c": {
+        "axiom": "!(1)F(200)/(45)A",
+        "rules": {
+            "A": "!(1.732)F(60)[&(25)$B]/(120)[&(25)$B]/(120)[&(25)$B]",
+            "B": "!(1.732)F(55)[&(25)$B]/(120)[&(25)$B]/(120)[&(25)$B]",
+            "L": _LEAF_HEX
+        },
+        "angle": 20,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "tropism_strength": 0.27,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": "ABOP 2.8c - Spreading (lr=1.79 high elongation)"
+    },
+
+    "ternary_2_8d": {
+        "axiom": "!(1)F(200)/(45)A",
+        "rules": {
+            "A": "!(1.732)F(50)[&(18)$BL]/(100)[&(22)$BL]/(140)[&(15)$BL]",
+            "B": "!(1.732)F(45)[&(18)$BL]/(100)[&(22)$BL]/(140)[&(15)$BL]",
+            "L": _LEAF_HEX
+        },
+        "angle": 20,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": True,
+        "tropism_strength": 0.40,
+        "tropism_direction": _TROPISM_WINDSWEPT,
+        "growth_mode": "sigmoid",
+        "description": "ABOP 2.8d - Windswept asymmetric tropism"
+    },
+
+    # =========================================================================
+    # Honda's Models - Research Validated
+    # =========================================================================
+    # NOTE: honda_realistic moved to PARAMETRIC_PRESETS as "honda_param"
+    # The original here was broken (used static values instead of recursive contraction)
+
+    # =========================================================================
+    # Simple Trees - Basic static versions for quick testing
+    # For true ABOP accuracy, use the parametric versions in PARAMETRIC_PRESETS
+    # =========================================================================
+    "oak_simple": {
+        "axiom": "F",
+        "rules": {
+            "F": "FF[&F][/&F][//&F][///&F]"
+        },
+        "angle": 30,
+        "iterations": 5,
+        "is_3d": True,
+        "render_polygons": False,
+        "tropism_strength": 0.12,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": "Simple oak-like branching (use oak_param for realistic)"
+    },
+
+    # =========================================================================
+    # Stochastic Trees - Organic Variation
+    # =========================================================================
+    "stochastic_tree_3d": {
+        "axiom": "!(1)F(200)A",
+        "rules": {
+            "A": "!(0.707)F(50)[&(35)$BL][/(137.5)&(35)$BL]/(137.5)A",
+            "B": "!(0.707)F(40)[+(30)$CL][-(30)$CL]",
+            "C": "!(0.707)F(30)L",
+            "L": _LEAF_HEX
+        },
+        "angle": 30,
+        "iterations": 8,
+        "is_3d": True,
+        "render_polygons": True,
+        "tropism_strength": 0.12,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": "Stochastic 3D tree - organic variation"
+    },
+
+    "stochastic_conifer": {
+        "axiom": "!(1)F(300)/(45)A",
+        "rules": {
+            "A": "!(1.732)F(50)[&(20)$B]/(120)[&(22)$B]/(120)[&(18)$B]/(45)A",
+            "B": "!(1.732)F(45)[&(20)$B]/(120)[&(22)$B]/(120)[&(18)$B]",
+            "L": _LEAF_NEEDLE
+        },
+        "angle": 20,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "tropism_strength": 0.15,
+        "tropism_direction": _TROPISM_DOWN,
+        "growth_mode": "sigmoid",
+        "description": "Stochastic conifer - varied whorls"
+    },
+}
@@ -0,0 +1,836 @@
+"""
+Parametric L-System Presets
+
+ABOP-style presets with parameterized, conditional and stochastic
+productions. Loaded by lsystem.presets on first use; import
+PARAMETRIC_PRESETS from there.
+"""
+
+from typing import Dict, Any
+
+from lsystem.presets import _LEAF_HEX, _TROPISM_DOWN, _TROPISM_WINDSWEPT
+
+
+# Sympodial (ABOP 2.7) and ternary (ABOP 2.8) variants share one production
+# template per family and differ only in the filled-in angles and tropism
+_SYMPODIAL_TEMPLATE = (
+    "!(w*0.707)F(l)[&({a1})$B(l*0.9,w*0.707){leaf}]"
+    "/(180)[&({a2})$B(l*0.8,w*0.707){leaf}]"
+)
+
+_TERNARY_TEMPLATE = (
+    "!(1.732)F(l)[&({a1})$B(l*{lr}){leaf}]"
+    "/({d1})[&({a2})$B(l*{lr}){leaf}]"
+    "/({d2})[&({a3})$B(l*{lr}){leaf}]"
+)
+
+
+def _with_leaves(params: str, successor: str, leaf: bool) -> list:
+    """Return the A/B productions for a successor, plus the leaf rule if used."""
+    productions = [f"A({params}) -> {successor}", f"B({params}) -> {successor}"]
+    if leaf:
+        productions.append("L -> " + _LEAF_HEX)
+    return productions
+
+
+def _make_sympodial_param(a1, a2, tropism_strength, description, leaf=False):
+    """Build a parametric sympodial preset with branch angles a1 and a2."""
+    successor = _SYMPODIAL_TEMPLATE.format(a1=a1, a2=a2, leaf="L" if leaf else "")
+    preset = {
+        "type": "parametric",
+        "axiom": "!(1)F(200)A(50,10)",
+        "productions": _with_leaves("l,w", successor, leaf),
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 35,
+        "iterations": 10,
+        "tropism_strength": tropism_strength,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "growth_mode": "sigmoid",
+        "description": description,
+    }
+    if leaf:
+        preset["render_polygons"] = True
+    return preset
+
+
+def _make_ternary_param(angles, d1, d2, lr, tropism_strength, description,
+                        leaf=False, length=50, iterations=7,
+                        tropism_direction=_TROPISM_DOWN):
+    """Build a parametric ternary preset with three whorl branch angles."""
+    a1, a2, a3 = angles
+    successor = _TERNARY_TEMPLATE.format(
+        a1=a1, a2=a2, a3=a3, d1=d1, d2=d2, lr=lr, leaf="L" if leaf else ""
+    )
+    preset = {
+        "type": "parametric",
+        "axiom": f"!(1)F(200)/(45)A({length})",
+        "productions": _with_leaves("l", successor, leaf),
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 20,
+        "iterations": iterations,
+        "tropism_strength": tropism_strength,
+        "tropism_direction": tropism_direction,
+        "is_3d": True,
+        "growth_mode": "sigmoid",
+        "description": description,
+    }
+    if leaf:
+        preset["render_polygons"] = True
+    return preset
+
+
+# (suffix, a1, a2, tropism_strength, description[, leaf])
+_SYMPODIAL_VARIANTS = (
+    ("a", 5, 65, 0.08, "Sympodial parametric a1=5, a2=65"),
+    ("b", 10, 60, 0.10, "Sympodial parametric a1=10, a2=60"),
+    ("c", 20, 50, 0.12, "Sympodial parametric a1=20, a2=50"),
+    ("d", 35, 35, 0.14, "Sympodial parametric SYMMETRIC a1=a2=35 [BEST]", True),
+)
+
+# (suffix, angles, d1, d2, lr, tropism_strength, description[, leaf, length,
+#  iterations, tropism_direction])
+_TERNARY_VARIANTS = (
+    ("a", (19, 19, 19), 94.74, 132.63, 0.9, 0.22,
+     "Ternary parametric d1=94.74, d2=132.63"),
+    ("b", (22, 22, 22), 137.5, 137.5, 0.9, 0.14,
+     "Ternary parametric golden angle 137.5 [BEST]", True),
+    ("c", (25, 25, 25), 120, 120, 1.1, 0.27,
+     "Ternary parametric spreading lr=1.79", False, 60, 6),
+    ("d", (18, 22, 15), 100, 140, 0.95, 0.40,
+     "Ternary parametric windswept asymmetric", True, 50, 7,
+     _TROPISM_WINDSWEPT),
+)
+
+
+PARAMETRIC_PRESETS: Dict[str, Dict[str, Any]] = {
+    # =========================================================================
+    # Parametric Trees - FIXED 3D
+    # =========================================================================
+    "monopodial_tree": {
+        "type": "parametric",
+        "axiom": "!(1)F(200)/(45)A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(45)B(l*0.6,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.6,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.6,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 45,
+        "iterations": 11,
+        "tropism_strength": 0.08,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "growth_mode": "sigmoid",
+        "description": "ABOP Fig 2.6 - Monopodial (FIXED 3D with roll) [BEST]"
+    },
+
+    "ternary_tree": {
+        "type": "parametric",
+        "axiom": "!(1)F(200)/(45)A",
+        "productions": [
+            "A -> !(1.732)F(50)[&(19)F(50)B]/(94.74)[&(19)F(50)B]/(132.63)[&(19)F(50)B]",
+            "B -> !(1.732)F(50)[&(19)F(50)B]/(94.74)[&(19)F(50)B]/(132.63)[&(19)F(50)B]",
+            "F(l) -> F(l*1.109)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {
+            "b": 94.74,
+            "c": 19,
+            "d": 1.109,
+            "h": 1.732
+        },
+        "angle": 20,
+        "iterations": 9,
+        "tropism_strength": 0.15,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "growth_mode": "sigmoid",
+        "description": "ABOP Fig 2.8 - Ternary (FIXED 3D whorls) [BEST]"
+    },
+
+    # =========================================================================
+    # Parametric Sympodial Variants (ABOP 2.7)
+    # =========================================================================
+    **{
+        f"sympodial_param_{suffix}": _make_sympodial_param(*variant)
+        for suffix, *variant in _SYMPODIAL_VARIANTS
+    },
+
+    # =========================================================================
+    # Parametric Ternary Variants (ABOP 2.8)
+    # =========================================================================
+    **{
+        f"ternary_param_{suffix}": _make_ternary_param(*variant)
+        for suffix, *variant in _TERNARY_VARIANTS
+    },
+
+    # =========================================================================
+    # Parametric Honda/Realistic Species Trees (ABOP-accurate)
+    # These use TRUE recursive contraction for realistic tree shapes
+    # =========================================================================
+    # =========================================================================
+    # SYMMETRIC Honda Trees with TINY GREEN LEAVES ON ALL BRANCHES
+    # Using f(0.02) for very small leaf polygons
+    # =========================================================================
+
+    "honda_symmetric_3": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l*0.3)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(45)$B(l*0.8,w*0.707)][+(45)$B(l*0.8,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Honda SYMMETRIC 3-way - TINY green leaves [BEST]"
+    },
+
+    "honda_symmetric_4": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l*0.3)[&(50)B(l*0.75,w*0.707)]/(90)[&(50)B(l*0.75,w*0.707)]/(90)[&(50)B(l*0.75,w*0.707)]/(90)[&(50)B(l*0.75,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(40)$B(l*0.8,w*0.707)][+(40)$B(l*0.8,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 6,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Honda SYMMETRIC 4-way - TINY green leaves"
+    },
+
+    "honda_symmetric_5": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l*0.3)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]F(l*0.7)A(l*0.92,w*0.85)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.015)+f(0.015)-|-f(0.015)+f(0.015)}][-(30)$B(l*0.75,w*0.707)][+(30)$B(l*0.75,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 6,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Honda SYMMETRIC 5-way pine - TINY green needles"
+    },
+
+    "honda_symmetric_full": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l*0.3)[&(55)B(l*0.9,w*0.707)]/(120)[&(55)B(l*0.9,w*0.707)]/(120)[&(55)B(l*0.9,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(50)$B(l*0.9,w*0.707)][+(50)$B(l*0.9,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Honda SYMMETRIC FULL - TINY dense green leaves [BEST]"
+    },
+
+    "honda_symmetric_weeping": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l*0.3)[&(55)B(l*0.85,w*0.707)]/(120)[&(55)B(l*0.85,w*0.707)]/(120)[&(55)B(l*0.85,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(45)$B(l*0.9,w*0.707)][+(45)$B(l*0.9,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 7,
+        "tropism_strength": 0.40,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Honda SYMMETRIC WEEPING - TINY leaves + gravity [BEST]"
+    },
+
+    "honda_symmetric_bare": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l*0.3)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$B(l*0.8,w*0.707)][+(45)$B(l*0.8,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 45,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda SYMMETRIC bare branches (no leaves)"
+    },
+
+    # =========================================================================
+    # CREATIVE STYLIZED PLANTS - Visually Interesting
+    # =========================================================================
+
+    # --- UMBRELLA TREE ---
+    # Flat spreading canopy like an acacia
+    "umbrella_tree": {
+        "type": "parametric",
+        "axiom": "!(10)F(1)A(0.5,6)",
+        "productions": [
+            # Tall trunk, then spreading flat branches at top
+            "A(l,w) -> !(w)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.008)+f(0.008)-|-f(0.008)+f(0.008)}][+(20)B(l*0.7,w*0.8)][-(20)B(l*0.7,w*0.8)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 6,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Umbrella/Acacia tree - flat spreading canopy"
+    },
+
+    # --- CORAL BRANCH ---
+    # Dense branching coral-like structure
+    "coral_branch": {
+        "type": "parametric",
+        "axiom": "A(1,8)",
+        "productions": [
+            # Bifurcating branches with slight randomness feel
+            "A(l,w) -> !(w)F(l)[+(30)&(20)A(l*0.75,w*0.75)][-(30)&(20)A(l*0.75,w*0.75)][&(40)A(l*0.6,w*0.7)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 30,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Coral branch - dense bifurcating structure"
+    },
+
+    # --- FLOWERING BURST ---
+    # Plant with colorful flower at branch tips
+    "flowering_burst": {
+        "type": "parametric",
+        "axiom": "!(8)F(0.5)A(0.4,5)",
+        "productions": [
+            # Main branching structure
+            "A(l,w) -> !(w)F(l)[&(45)B(l*0.7,w*0.707)]/(90)[&(50)B(l*0.7,w*0.707)]/(90)[&(45)B(l*0.7,w*0.707)]/(90)[&(50)B(l*0.7,w*0.707)]F(l*0.5)A(l*0.8,w*0.707)",
+            # Branches with flowers (pink/red) at tips
+            "B(l,w) : l > 0.1 -> !(w)F(l)[-(40)B(l*0.7,w*0.75)][+(40)B(l*0.7,w*0.75)]",
+            "B(l,w) : l <= 0.1 -> !(w)F(l)[''''^^{-f(0.008)+f(0.008)+f(0.008)-|-f(0.008)+f(0.008)+f(0.008)}]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Flowering burst - pink flowers at branch tips"
+    },
+
+    # --- TWISTED BONSAI ---
+    # Asymmetric windswept bonsai style
+    "twisted_bonsai": {
+        "type": "parametric",
+        "axiom": "!(10)&(10)/(20)F(0.8)A(0.5,6)",
+        "productions": [
+            # Asymmetric branching with strong bias to one side
+            "A(l,w) -> !(w)F(l)[&(60)/(30)B(l*0.8,w*0.707)][&(40)/(-60)B(l*0.5,w*0.6)]/(80)A(l*0.85,w*0.75)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.008)+f(0.008)-|-f(0.008)+f(0.008)}][&(35)B(l*0.7,w*0.707)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 7,
+        "tropism_strength": 0.15,
+        "tropism_direction": (0.3, -1.0, 0.1),
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Twisted bonsai - asymmetric windswept style"
+    },
+
+    # --- PALM FROND ---
+    # Fan-like palm with long fronds
+    "palm_fan": {
+        "type": "parametric",
+        "axiom": "!(12)F(1.2)A(0.8,8)",
+        "productions": [
+            # Crown of fronds spreading outward
+            "A(l,w) -> [&(70)B(l,w*0.3)]/(51.4)[&(65)B(l,w*0.3)]/(51.4)[&(75)B(l,w*0.3)]/(51.4)[&(60)B(l,w*0.3)]/(51.4)[&(70)B(l,w*0.3)]/(51.4)[&(65)B(l,w*0.3)]/(51.4)[&(75)B(l,w*0.3)]",
+            # Each frond with leaflets along its length
+            "B(l,w) -> !(w)F(l*0.3)[''''''''+(60){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}][''''''''-(60){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}]F(l*0.25)[''''''''+(55){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}][''''''''-(55){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}]F(l*0.2)[''''''''+(50){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}][''''''''-(50){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}]F(l*0.15)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 3,
+        "tropism_strength": 0.25,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Palm fan - tropical palm with drooping fronds"
+    },
+
+    # --- CRYSTAL TREE ---
+    # Geometric crystalline branching structure
+    "crystal_tree": {
+        "type": "parametric",
+        "axiom": "!(8)F(0.6)A(0.5,6)",
+        "productions": [
+            # 6-way symmetric branching like ice crystals
+            "A(l,w) -> !(w)F(l)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]A(l*0.7,w*0.8)",
+            "B(l,w) -> !(w)F(l)[&(60)B(l*0.5,w*0.7)][^(60)B(l*0.5,w*0.7)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 60,
+        "iterations": 5,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "linear",
+        "description": "Crystal tree - 6-way symmetric geometric branching"
+    },
+
+    # --- VINE SPIRAL ---
+    # Climbing vine that spirals upward
+    "vine_spiral": {
+        "type": "parametric",
+        "axiom": "A(1,5)",
+        "productions": [
+            # Spiral climb with leaves at each node
+            "A(l,w) -> !(w)F(l*0.15)[''''''''&(70){-f(0.008)+f(0.008)-|-f(0.008)+f(0.008)}]/(90)&(5)A(l*0.98,w*0.98)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 35,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "linear",
+        "description": "Vine spiral - climbing spiral with leaves"
+    },
+
+    # --- FERN UNFURL ---
+    # Fern frond with curled tip (fiddlehead)
+    "fern_unfurl": {
+        "type": "parametric",
+        "axiom": "!(6)&(15)A(0.8,5)",
+        "productions": [
+            # Main rachis with pinnae, curling at tip
+            "A(l,w) -> !(w)F(l*0.12)[''''''''+(70){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}][''''''''-(70){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}]^(8)A(l*0.94,w*0.95)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 30,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Fern unfurl - curling fiddlehead frond"
+    },
+
+    # --- EXPLOSION BUSH ---  
+    # Dramatic radiating growth from center
+    "explosion_bush": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            # Multiple branches exploding outward at each level
+            "A(l,w) -> !(w)F(l*0.2)[&(30)B(l*0.9,w*0.65)]/(72)[&(35)B(l*0.85,w*0.65)]/(72)[&(30)B(l*0.9,w*0.65)]/(72)[&(35)B(l*0.85,w*0.65)]/(72)[&(30)B(l*0.9,w*0.65)]A(l*0.7,w*0.707)",
+            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}][&(25)B(l*0.75,w*0.707)][/(90)&(25)B(l*0.7,w*0.65)]"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 6,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "apical",
+        "description": "Explosion bush - dramatic radiating growth"
+    },
+
+    # --- WEEPING CANOPY ---
+    # Dense drooping branches like a weeping willow
+    "weeping_canopy": {
+        "type": "parametric",
+        "axiom": "!(12)F(0.8)A(0.6,8)",
+        "productions": [
+            # Umbrella of drooping branches
+            "A(l,w) -> !(w)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]/(45)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]/(45)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]/(45)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]",
+            # Long trailing branches with small leaves
+            "B(l,w) -> !(w)F(l*0.15)[''''''''^^{-f(0.004)+f(0.004)-|-f(0.004)+f(0.004)}]B(l*0.92,w*0.9)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 22.5,
+        "iterations": 12,
+        "tropism_strength": 0.5,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Weeping canopy - dense drooping willow style"
+    },
+
+    # =========================================================================
+    # ABOP Figure 2.6 - Honda's Original SPIRAL Trees (for reference)
+    # These have the characteristic spiral phyllotaxis pattern
+    # =========================================================================
+
+    "honda_2_6a": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(45)B(l*0.6,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.6,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.6,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {"r1": 0.9, "r2": 0.6, "a0": 45, "a2": 45, "d": 137.5, "wr": 0.707},
+        "angle": 45,
+        "iterations": 10,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "ABOP Fig 2.6a - Excurrent/conifer SPIRAL (r1=0.9, r2=0.6)"
+    },
+
+    "honda_2_6b": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(45)B(l*0.9,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.9,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.9,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {"r1": 0.9, "r2": 0.9, "a0": 45, "a2": 45, "d": 137.5, "wr": 0.707},
+        "angle": 45,
+        "iterations": 10,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "ABOP Fig 2.6b - Decurrent/deciduous SPIRAL (r1=0.9, r2=0.9)"
+    },
+
+    "honda_2_6c": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(45)B(l*0.8,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.8,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.8,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {"r1": 0.9, "r2": 0.8, "a0": 45, "a2": 45, "d": 137.5, "wr": 0.707},
+        "angle": 45,
+        "iterations": 10,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "ABOP Fig 2.6c - Intermediate SPIRAL (r1=0.9, r2=0.8)"
+    },
+
+    "honda_2_6d": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(30)B(l*0.7,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(-30)$C(l*0.7,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(-30)$B(l*0.7,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {"r1": 0.9, "r2": 0.7, "a0": 30, "a2": -30, "d": 137.5, "wr": 0.707},
+        "angle": 30,
+        "iterations": 10,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "ABOP Fig 2.6d - Narrow columnar SPIRAL (r1=0.9, r2=0.7)"
+    },
+
+    # =========================================================================
+    # WHORLED Honda Variants - Multiple branches per level (NO spiral look)
+    # These look more like traditional "tree" silhouettes
+    # =========================================================================
+
+    "honda_whorled_3": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(45)B(l*0.8,w*0.707)][/(120)&(45)B(l*0.8,w*0.707)][/(240)&(45)B(l*0.8,w*0.707)]/(45)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.8,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.8,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 45,
+        "iterations": 8,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda 3-WHORLED - 3 branches per level (no spiral) [BEST]"
+    },
+
+    "honda_whorled_4": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(50)B(l*0.75,w*0.707)][/(90)&(50)B(l*0.75,w*0.707)][/(180)&(50)B(l*0.75,w*0.707)][/(270)&(50)B(l*0.75,w*0.707)]/(45)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(40)$C(l*0.8,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(40)$B(l*0.8,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 45,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda 4-WHORLED - 4 branches per level, spreading crown"
+    },
+
+    "honda_whorled_5": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(35)B(l*0.7,w*0.707)][/(72)&(35)B(l*0.7,w*0.707)][/(144)&(35)B(l*0.7,w*0.707)][/(216)&(35)B(l*0.7,w*0.707)][/(288)&(35)B(l*0.7,w*0.707)]/(36)A(l*0.92,w*0.85)",
+            "B(l,w) -> !(w)F(l)[-(30)$C(l*0.75,w*0.707)]C(l*0.85,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(30)$B(l*0.75,w*0.707)]B(l*0.85,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 35,
+        "iterations": 7,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda 5-WHORLED - conifer/pine style with 5 branches per level"
+    },
+
+    "honda_whorled_full": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(55)B(l*0.9,w*0.707)][/(120)&(55)B(l*0.9,w*0.707)][/(240)&(55)B(l*0.9,w*0.707)]/(60)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(50)$C(l*0.9,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(50)$B(l*0.9,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 50,
+        "iterations": 8,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda WHORLED FULL - very dense deciduous crown (r2=0.9) [BEST]"
+    },
+
+    # =========================================================================
+    # Honda Variants with Tropism (for weeping/gravity effects)
+    # =========================================================================
+
+    "honda_weeping": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(50)B(l*0.8,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.85,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.85,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 45,
+        "iterations": 10,
+        "tropism_strength": 0.35,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda with strong gravity - weeping willow effect"
+    },
+
+    "honda_whorled_weeping": {
+        "type": "parametric",
+        "axiom": "A(1,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(55)B(l*0.85,w*0.707)][/(120)&(55)B(l*0.85,w*0.707)][/(240)&(55)B(l*0.85,w*0.707)]/(60)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.9,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.9,w*0.707)]B(l*0.9,w*0.707)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 50,
+        "iterations": 8,
+        "tropism_strength": 0.40,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Honda WHORLED WEEPING - full crown with gravity droop [BEST]"
+    },
+
+    "oak_param": {
+        "type": "parametric",
+        "axiom": "!(12)F(250)A(60,8)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(45)$B(l*0.65,w*0.707)][/(90)&(50)$B(l*0.65,w*0.707)][/(180)&(45)$B(l*0.65,w*0.707)][/(270)&(50)$B(l*0.65,w*0.707)]/(45)A(l*0.85,w*0.707)",
+            "B(l,w) -> !(w)F(l)[+(35)$C(l*0.7,w*0.707)][-(35)$C(l*0.7,w*0.707)]/(137.5)B(l*0.8,w*0.707)",
+            "C(l,w) : l > 5 -> !(w)F(l)[&(30)$C(l*0.6,w*0.707)]",
+            "C(l,w) : l <= 5 -> !(w)F(l)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 35,
+        "iterations": 7,
+        "tropism_strength": 0.12,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Oak - spreading crown with 4-way whorls (parametric)"
+    },
+
+    "elm_param": {
+        "type": "parametric",
+        "axiom": "!(12)F(300)A(55,9)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(55)$B(l*0.7,w*0.707)][/(90)&(60)$B(l*0.65,w*0.707)][/(180)&(55)$B(l*0.7,w*0.707)][/(270)&(60)$B(l*0.65,w*0.707)]/(60)A(l*0.9,w*0.707)",
+            "B(l,w) -> !(w)F(l)[&(40)$C(l*0.65,w*0.707)][/(180)&(40)$C(l*0.65,w*0.707)]/(137.5)B(l*0.85,w*0.707)",
+            "C(l,w) : l > 8 -> !(w)F(l)[&(35)$C(l*0.6,w*0.707)]",
+            "C(l,w) : l <= 8 -> !(w)F(l)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 30,
+        "iterations": 7,
+        "tropism_strength": 0.10,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Elm - vase-shaped crown (parametric)"
+    },
+
+    "willow_param": {
+        "type": "parametric",
+        "axiom": "!(12)F(200)A(70,8)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(60)$B(l*0.8,w*0.707)][/(90)&(70)$B(l*0.75,w*0.707)][/(180)&(60)$B(l*0.8,w*0.707)][/(270)&(70)$B(l*0.75,w*0.707)]/(137.5)A(l*0.85,w*0.707)",
+            "B(l,w) -> !(w)F(l)[&(40)$C(l*0.85,w*0.707)][/(180)&(40)$C(l*0.85,w*0.707)]C(l*0.9,w*0.707)",
+            "C(l,w) : l > 5 -> !(w)F(l)C(l*0.95,w*0.8)",
+            "C(l,w) : l <= 5 -> !(w)F(l)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 25,
+        "iterations": 6,
+        "tropism_strength": 0.45,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Willow - extreme droop with long trailing branches"
+    },
+
+    "pine_param": {
+        "type": "parametric",
+        "axiom": "!(12)F(250)/(45)A(40,8)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(25)$B(l*0.5,w*0.707)][/(72)&(25)$B(l*0.5,w*0.707)][/(144)&(25)$B(l*0.5,w*0.707)][/(216)&(25)$B(l*0.5,w*0.707)][/(288)&(25)$B(l*0.5,w*0.707)]/(137.5)A(l*0.95,w*0.85)",
+            "B(l,w) -> !(w)F(l)[&(15)$C(l*0.7,w*0.707)]C(l*0.8,w*0.707)",
+            "C(l,w) : l > 8 -> !(w)F(l)C(l*0.85,w*0.707)",
+            "C(l,w) : l <= 8 -> !(w)F(l)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 25,
+        "iterations": 8,
+        "tropism_strength": 0.05,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Pine - 5-way whorled conical conifer"
+    },
+
+    "spruce_param": {
+        "type": "parametric",
+        "axiom": "!(14)F(300)/(45)A(35,10)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(30)$B(l*0.45,w*0.707)][/(60)&(30)$B(l*0.45,w*0.707)][/(120)&(30)$B(l*0.45,w*0.707)][/(180)&(30)$B(l*0.45,w*0.707)][/(240)&(30)$B(l*0.45,w*0.707)][/(300)&(30)$B(l*0.45,w*0.707)]/(137.5)A(l*0.92,w*0.9)",
+            "B(l,w) -> !(w)F(l)[&(20)$C(l*0.6,w*0.707)]C(l*0.75,w*0.707)",
+            "C(l,w) : l > 6 -> !(w)F(l)C(l*0.8,w*0.707)",
+            "C(l,w) : l <= 6 -> !(w)F(l)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 20,
+        "iterations": 9,
+        "tropism_strength": 0.08,
+        "tropism_direction": _TROPISM_DOWN,
+        "is_3d": True,
+        "render_polygons": False,
+        "growth_mode": "sigmoid",
+        "description": "Spruce - dense 6-way whorled Christmas tree shape"
+    },
+
+    "bonsai_param": {
+        "type": "parametric",
+        "axiom": "!(8)F(150)&(15)/(30)A(50,6)",
+        "productions": [
+            "A(l,w) -> !(w)F(l)[&(50)$B(l*0.55,w*0.707)][/(120)&(60)$B(l*0.5,w*0.707)]/(200)A(l*0.7,w*0.707)",
+            "B(l,w) -> !(w)F(l)[+(40)$C(l*0.6,w*0.707)][-(50)$C(l*0.55,w*0.707)]",
+            "C(l,w) : l > 10 -> !(w)F(l)[&(35)$C(l*0.5,w*0.707)]",
+            "C(l,w) : l <= 10 -> !(w)F(l)"
+        ],
+        "rules": {"info": "Parametric - see 'productions'"},
+        "constants": {},
+        "angle": 35,
+        "iterations": 7,
+        "tropism_strength": 0.25,
+        "tropism_direction": (0.2, -1.0, 0.1),
+        "is_3d": True,
+        "render_polygons": True,
+        "growth_mode": "sigmoid",
+        "description": "Bonsai - asymmetric artistic windswept style"
+    },
+
+    # =========================================================================
+    # Stochastic
+    # =========================================================================
+    "stochastic_plant": {
+        "type": "parametric",
+        "axiom": "F",
+        "productions": [
+            {"rule": "F -> F[-F]F[+F]F", "probability": 0.33},
+            {"rule": "F -> F[-F]F", "probability": 0.33},
+            {"rule": "F -> F[+F]F", "probability": 0.34}
+        ],
+        "rules": {"info": "Stochastic - see 'productions'"},
+        "angle": 28,
+        "iterations": 6,
+        "growth_mode": "sigmoid",
+        "description": "ABOP p.28 - Stochastic L-system with variation"
+    },
+}
@@ -4,6 +4,7 @@ L-System Engine
 Implements a standard L-system processor with memoization and safety limits.
 """
 
+from collections import Counter
 from functools import lru_cache
 from typing import Dict, Optional
 
@@ -42,6 +43,13 @@ class LSystem:
         self.rules = rules
         self.iterations = iterations
         self._cache: Dict[tuple, str] = {}
+        
+        # Single-character predecessors can be rewritten by str.translate,
+        # which applies every rule in one C-level pass over the string
+        if rules and all(len(symbol) == 1 for symbol in rules):
+            self._translate_table = str.maketrans(rules)
+        else:
+            self._translate_table = None
     
     def _apply_rules(self, string: str) -> str:
         """
@@ -56,16 +64,34 @@ class LSystem:
         Raises:
             LSystemError: If result exceeds maximum length
         """
+        if self._translate_table is not None:
+            # Size the result up front so the limit is enforced before allocating
+            length = len(string) + sum(
+                string.count(symbol) * (len(replacement) - 1)
+                for symbol, replacement in self.rules.items()
+            )
+            if length > self.MAX_STRING_LENGTH:
+                raise LSystemError(
+                    f"L-system string exceeded maximum length of {self.MAX_STRING_LENGTH:,} characters. "
+                    "Try reducing iterations."
+                )
+            return string.translate(self._translate_table)
+        
         result = []
+        append = result.append
+        get = self.rules.get
+        max_length = self.MAX_STRING_LENGTH
+        length = 0
         for char in string:
             # Apply rule if it exists, otherwise keep the character
-            replacement = self.rules.get(char, char)
-            result.append(replacement)
+            replacement = get(char, char)
+            append(replacement)
             
-            # Check length periodically to avoid memory issues
-            if len(result) > 1000 and sum(len(s) for s in result) > self.MAX_STRING_LENGTH:
+            # Track the running length to avoid memory issues
+            length += len(replacement)
+            if length > max_length:
                 raise LSystemError(
-                    f"L-system string exceeded maximum length of {self.MAX_STRING_LENGTH:,} characters. "
+                    f"L-system string exceeded maximum length of {max_length:,} characters. "
                     "Try reducing iterations."
                 )
         
@@ -171,3 +197,76 @@ def parse_rules(rules_string: str) -> Dict[str, str]:
             symbol, replacement = rule.split(':', 1)
             rules[symbol.strip()] = replacement.strip()
     return rules
+
+
+def make_rewriter(rules: Dict[str, str]):
+    """
+    Build an expansion function specialized to one set of rules.
+    
+    Each successor's symbol counts are computed once. Symbol counts of the
+    next word follow from those of the current one, so the length of every
+    iteration is known from the axiom alone: an expansion that would
+    exceed the limit fails before any rewriting.
+    
+    The same pass records which symbols occur after each iteration. The
+    rules are deterministic, so every occurrence of a symbol with k
+    iterations left expands to the same string; the word is built back up
+    from the last iteration, expanding each (symbol, k) once and joining
+    the shared results, instead of rewriting every character every time.
+    
+    Args:
+        rules: Production rules with single-character predecessors
+        
+    Returns:
+        Function (axiom, iterations) -> expanded string, or None if a
+        predecessor is longer than one character. Its length attribute,
+        length(axiom, iterations), returns the expanded length from the
+        symbol counts alone.
+    """
+    if not all(len(symbol) == 1 for symbol in rules):
+        return None
+    produces = {
+        symbol: tuple(Counter(replacement).items())
+        for symbol, replacement in rules.items()
+    }
+    max_length = LSystem.MAX_STRING_LENGTH
+    
+    def counts_by_iteration(axiom: str, iterations: int):
+        """Yield the symbol counts of the word after each iteration."""
+        counts = Counter(axiom)
+        yield counts
+        for _ in range(iterations):
+            following = Counter()
+            for symbol, count in counts.items():
+                for produced, n in produces.get(symbol, ((symbol, 1),)):
+                    following[produced] += count * n
+            counts = following
+            if sum(counts.values()) > max_length:
+                raise LSystemError(
+                    f"L-system string exceeded maximum length of {max_length:,} characters. "
+                    "Try reducing iterations."
+                )
+            yield counts
+    
+    def length(axiom: str, iterations: int) -> int:
+        """Length of the expanded word, without building it."""
+        for counts in counts_by_iteration(axiom, iterations):
+            pass
+        return sum(counts.values())
+    
+    def rewrite(axiom: str, iterations: int) -> str:
+        # Symbols present in the word after each iteration
+        present = [counts.keys() for counts in counts_by_iteration(axiom, iterations)]
+        
+        # symbol -> its expansion over the iterations still to come
+        expansion = {symbol: symbol for symbol in present.pop()}
+        for symbols in reversed(present):
+            expansion = {
+                symbol: ''.join([expansion[c] for c in rules.get(symbol, symbol)])
+                for symbol in symbols
+            }
+        return ''.join([expansion[c] for c in axiom])
+    
+    rewrite.length = length
+    return rewrite
+
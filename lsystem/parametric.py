@@ -18,9 +18,12 @@ Example:
     p3: F(l) → F(l * 1.1)
 """
 
+import ast
 import re
 import random
 import math
+from bisect import bisect_left
+from itertools import accumulate
 from dataclasses import dataclass, field
 from typing import List, Tuple, Dict, Optional, Any, Union
 from functools import lru_cache
@@ -31,16 +34,21 @@ class ParametricLSystemError(Exception):
     pass
 
 
-@dataclass
 class Module:
     """
     A parameterized L-system module.
     
     Represents a symbol with optional numeric parameters.
     Examples: A(1, 2), F(10.5), +, [-
+    
+    A plain class with __slots__ rather than a dataclass: derivations hold
+    millions of modules, and slots drop the per-instance __dict__.
     """
-    symbol: str
-    params: Tuple[float, ...] = field(default_factory=tuple)
+    __slots__ = ('symbol', 'params')
+    
+    def __init__(self, symbol: str, params: Tuple[float, ...] = ()):
+        self.symbol = symbol
+        self.params = params
     
     def __repr__(self) -> str:
         if self.params:
@@ -96,6 +104,18 @@ class Production:
     probability: float = 1.0
     left_context: Optional[str] = None
     right_context: Optional[str] = None
+    # Compiled once per production instead of looked up on every rewrite
+    _condition_code: Any = field(default=None, init=False, repr=False, compare=False)
+    _compiled_successor: tuple = field(default=(), init=False, repr=False, compare=False)
+    _successor_fn: Any = field(default=None, init=False, repr=False, compare=False)
+    _condition_fn: Any = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.condition:
+            self._condition_code = _compile_expr(self.condition)
+            self._condition_fn = _condition_function(self.condition)
+        self._compiled_successor = compile_successor(self.successor)
+        self._successor_fn = _successor_function(self.successor)
     
     def matches(self, module: Module, params_dict: Dict[str, float]) -> bool:
         """
@@ -121,24 +141,18 @@ class Production:
         if not self.condition:
             return True
         
-        expr = self.condition
-        # Replace parameter names with values
-        for name, value in params.items():
-            expr = re.sub(rf'\b{re.escape(name)}\b', str(value), expr)
+        code = self._condition_code
+        if code is None:
+            return False
+        
+        if self._condition_fn is not None:
+            result = self._condition_fn(params)
+            if result is not None:
+                return result
         
         try:
-            # Safe evaluation with math functions
-            return bool(eval(expr, {"__builtins__": {}}, {
-                "sqrt": math.sqrt, 
-                "abs": abs, 
-                "sin": math.sin,
-                "cos": math.cos, 
-                "tan": math.tan,
-                "min": min, 
-                "max": max,
-                "pi": math.pi,
-                "e": math.e
-            }))
+            # Parameter values shadow the math helpers, as with substitution
+            return bool(eval(code, _SAFE_GLOBALS, {**_CONDITION_FUNCS, **params}))
         except Exception:
             return False
     
@@ -157,16 +171,123 @@ class Production:
         Returns:
             List of Module objects representing the successor
         """
-        all_params = dict(params)
         if constants:
-            all_params.update(constants)
-        return parse_parametric_word(self.successor, all_params)
+            params = {**params, **constants}
+        if self._successor_fn is not None:
+            modules = self._successor_fn(params)
+            if modules is not None:
+                return modules
+        return _evaluate_word(self._compiled_successor, params)
 
 
 # =============================================================================
 # Parsing Functions
 # =============================================================================
 
+# Namespaces for expression evaluation; parameter values are layered on top
+_SAFE_GLOBALS = {"__builtins__": {}}
+
+_CONDITION_FUNCS = {
+    "sqrt": math.sqrt, 
+    "abs": abs, 
+    "sin": math.sin,
+    "cos": math.cos, 
+    "tan": math.tan,
+    "min": min, 
+    "max": max,
+    "pi": math.pi,
+    "e": math.e
+}
+
+_EXPR_FUNCS = {
+    "sqrt": math.sqrt,
+    "abs": abs,
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "log": math.log,
+    "exp": math.exp,
+    "min": min,
+    "max": max,
+    "pi": math.pi,
+    "e": math.e,
+    "pow": pow
+}
+
+
+@lru_cache(maxsize=None)
+def _compile_expr(expr: str):
+    """
+    Compile an expression string to a code object (cached per string).
+    
+    Returns:
+        Code object, or None if the expression is not valid Python
+    """
+    try:
+        return compile(expr, "<expr>", "eval")
+    except SyntaxError:
+        return None
+
+
+def _eval_code(code, params: Dict[str, float]) -> float:
+    """Evaluate a compiled expression with parameter values in scope."""
+    if code is None:
+        return 0.0
+    try:
+        return float(eval(code, _SAFE_GLOBALS, {**_EXPR_FUNCS, **params}))
+    except Exception:
+        return 0.0
+
+
+# Argument opcodes: most successor arguments are a literal, a parameter, or
+# a parameter times a literal, which are evaluated without eval()
+_OP_CONST = 0
+_OP_LOAD = 1
+_OP_MUL = 2
+_OP_EVAL = 3
+
+
+@lru_cache(maxsize=None)
+def _compile_arg(expr: str) -> Tuple[int, Optional[str], float, Any]:
+    """
+    Compile one argument expression to an (op, name, value, code) tuple.
+    
+    Constant expressions are folded, `name` and `name*literal` become a
+    direct lookup, and anything else keeps its code object for eval();
+    for those `name` holds the expression text.
+    """
+    code = _compile_expr(expr)
+    if code is None:
+        return (_OP_CONST, None, 0.0, None)
+    if not code.co_names:
+        return (_OP_CONST, None, _eval_code(code, {}), code)
+    
+    node = ast.parse(expr, mode="eval").body
+    if isinstance(node, ast.Name):
+        return (_OP_LOAD, node.id, 1.0, code)
+    if (isinstance(node, ast.BinOp) and isinstance(node.op, ast.Mult)
+            and isinstance(node.left, ast.Name)
+            and isinstance(node.right, ast.Constant)
+            and type(node.right.value) in (int, float)):
+        return (_OP_MUL, node.left.id, node.right.value, code)
+    return (_OP_EVAL, expr, 0.0, code)
+
+
+def _eval_arg(arg: Tuple[int, Optional[str], float, Any], params: Dict[str, float]) -> float:
+    """Evaluate an argument compiled by _compile_arg."""
+    op, name, value, code = arg
+    if op == _OP_CONST:
+        return value
+    if op != _OP_EVAL and name in params:
+        try:
+            if op == _OP_MUL:
+                return float(params[name] * value)
+            return float(params[name])
+        except Exception:
+            pass
+    return _eval_code(code, params)
+
+
 def _eval_expr(expr: str, params: Dict[str, float]) -> float:
     """
     Evaluate arithmetic expression with parameter substitution.
@@ -178,54 +299,25 @@ def _eval_expr(expr: str, params: Dict[str, float]) -> float:
     Returns:
         Evaluated numeric result
     """
-    # Substitute parameter names with values
-    result_expr = expr
-    for name, value in params.items():
-        result_expr = re.sub(rf'\b{re.escape(name)}\b', str(value), result_expr)
-    
-    try:
-        return float(eval(result_expr, {"__builtins__": {}}, {
-            "sqrt": math.sqrt,
-            "abs": abs,
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "log": math.log,
-            "exp": math.exp,
-            "min": min,
-            "max": max,
-            "pi": math.pi,
-            "e": math.e,
-            "pow": pow
-        }))
-    except Exception:
-        return 0.0
+    return _eval_code(_compile_expr(expr), params)
 
 
-def parse_parametric_word(
-    word: str, 
-    params: Optional[Dict[str, float]] = None
-) -> List[Module]:
+@lru_cache(maxsize=None)
+def compile_successor(word: str) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
     """
-    Parse a parametric word string into modules.
+    Tokenize a parametric word once into (symbol, compiled_args) pairs.
+    
+    Each argument expression is compiled by _compile_arg, so applying a
+    production only evaluates the compiled form instead of re-parsing the
+    string. Results are cached per word.
     
     Args:
         word: String like "A(1,2)F(3)B" or "F(l*0.9)[+A(l,w)]"
-        params: Parameter substitutions for expressions
-    
-    Returns:
-        List of Module objects
         
-    Examples:
-        >>> parse_parametric_word("A(1,2)F(3)")
-        [Module('A', (1.0, 2.0)), Module('F', (3.0,))]
-        >>> parse_parametric_word("F(l*0.9)", {"l": 10})
-        [Module('F', (9.0,))]
+    Returns:
+        Tuple of (symbol, tuple_of_compiled_args) pairs
     """
-    if params is None:
-        params = {}
-    
-    modules = []
+    tokens = []
     i = 0
     
     while i < len(word):
@@ -245,30 +337,187 @@ def parse_parametric_word(
                     paren_depth -= 1
                 j += 1
             
-            # Extract and parse parameters
+            # Extract and compile parameters
             param_str = word[start:j-1]
             if param_str.strip():
                 # Split by comma, respecting nested parentheses
                 expr_list = _split_params(param_str)
-                values = tuple(_eval_expr(e.strip(), params) for e in expr_list)
+                codes = tuple(_compile_arg(e.strip()) for e in expr_list)
             else:
-                values = ()
+                codes = ()
             
-            modules.append(Module(symbol, values))
+            tokens.append((symbol, codes))
             i = j
             
         # Simple symbol (including special characters)
         elif char in 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz':
-            modules.append(Module(char))
+            tokens.append((char, ()))
             i += 1
         elif char in '+-[]&^/\\|!$.\'"{}%~':
-            modules.append(Module(char))
+            tokens.append((char, ()))
             i += 1
         else:
             # Skip whitespace and unrecognized characters
             i += 1
     
-    return modules
+    return tuple(tokens)
+
+
+def _evaluate_word(
+    tokens: Tuple[Tuple[str, Tuple[Any, ...]], ...],
+    params: Dict[str, float]
+) -> List[Module]:
+    """Build modules from compiled tokens for the given parameter values."""
+    return [
+        Module(symbol, tuple(_eval_arg(arg, params) for arg in codes))
+        if codes else Module(symbol)
+        for symbol, codes in tokens
+    ]
+
+
+# Syntax that generated code may inline: parameters and number literals
+# combined with arithmetic, comparisons and boolean logic
+_INLINE_NODES = (
+    ast.Expression, ast.Constant, ast.Name, ast.Load,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Div,
+    ast.UnaryOp, ast.UAdd, ast.USub, ast.Not,
+    ast.Compare, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+    ast.BoolOp, ast.And, ast.Or,
+)
+
+
+def _inline_expr(expr: str, names: Dict[str, str]) -> Optional[str]:
+    """
+    Rewrite an expression as Python source that reads parameters from locals.
+    
+    Each parameter name is bound to a local from `names`, adding new ones
+    as needed. Function calls, attribute access and anything else outside
+    _INLINE_NODES are refused.
+    
+    Returns:
+        Source string, or None if the expression needs eval()
+    """
+    try:
+        tree = ast.parse(expr, mode="eval")
+    except SyntaxError:
+        return None
+    for node in ast.walk(tree):
+        if not isinstance(node, _INLINE_NODES):
+            return None
+        if isinstance(node, ast.Constant) and (
+                type(node.value) not in (int, float) or not math.isfinite(node.value)):
+            return None
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            node.id = names.setdefault(node.id, f"v{len(names)}")
+    return ast.unparse(tree)
+
+
+def _load_lines(names: Dict[str, str], indent: str) -> List[str]:
+    """Source lines binding each parameter's local from the params dict."""
+    return [f"{indent}{local} = params[{name!r}]" for name, local in names.items()]
+
+
+@lru_cache(maxsize=None)
+def _condition_function(condition: str):
+    """
+    Generate a function that tests a condition without eval().
+    
+    The function returns True or False, or None when a parameter is
+    missing or the test raises, letting the caller fall back to eval()
+    with the math helpers in scope. Results are cached per condition.
+    
+    Returns:
+        The function, or None if the condition needs eval()
+    """
+    names: Dict[str, str] = {}
+    source = _inline_expr(condition, names)
+    if source is None:
+        return None
+    lines = ["def condition(params):", "    try:"]
+    lines += _load_lines(names, "        ")
+    lines += [
+        f"        return bool({source})",
+        "    except Exception:",
+        "        return None",
+    ]
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["condition"]
+
+
+@lru_cache(maxsize=None)
+def _successor_function(word: str):
+    """
+    Generate a straight-line function that builds a successor's modules.
+    
+    The function takes the parameter dictionary and inlines every argument
+    as Python arithmetic on locals, so no token loop or eval() runs per
+    rewrite. It returns None when a lookup or an operation fails, letting
+    the caller fall back to _evaluate_word. Results are cached per word.
+    
+    Returns:
+        The function, or None if an argument needs eval()
+    """
+    names: Dict[str, str] = {}
+    items = []
+    for symbol, args in compile_successor(word):
+        values = []
+        for op, name, value, _ in args:
+            if op == _OP_EVAL:
+                source = _inline_expr(name, names)
+                if source is None:
+                    return None
+                values.append(f"float({source})")
+                continue
+            if not math.isfinite(value):
+                return None
+            if op == _OP_CONST:
+                values.append(repr(value))
+                continue
+            local = names.setdefault(name, f"v{len(names)}")
+            if op == _OP_MUL:
+                values.append(f"float({local} * {value!r})")
+            else:
+                values.append(f"float({local})")
+        if values:
+            items.append(f"Module({symbol!r}, ({', '.join(values)},))")
+        else:
+            items.append(f"Module({symbol!r})")
+    
+    lines = ["def successor(params):", "    try:"]
+    lines += _load_lines(names, "        ")
+    lines += [
+        f"        return [{', '.join(items)}]",
+        "    except Exception:",
+        "        return None",
+    ]
+    namespace = {"Module": Module}
+    exec("\n".join(lines), namespace)
+    return namespace["successor"]
+
+
+def parse_parametric_word(
+    word: str, 
+    params: Optional[Dict[str, float]] = None
+) -> List[Module]:
+    """
+    Parse a parametric word string into modules.
+    
+    Args:
+        word: String like "A(1,2)F(3)B" or "F(l*0.9)[+A(l,w)]"
+        params: Parameter substitutions for expressions
+    
+    Returns:
+        List of Module objects
+        
+    Examples:
+        >>> parse_parametric_word("A(1,2)F(3)")
+        [Module('A', (1.0, 2.0)), Module('F', (3.0,))]
+        >>> parse_parametric_word("F(l*0.9)", {"l": 10})
+        [Module('F', (9.0,))]
+    """
+    return _evaluate_word(compile_successor(word), params or {})
 
 
 def _split_params(param_str: str) -> List[str]:
@@ -281,6 +530,12 @@ def _split_params(param_str: str) -> List[str]:
     Returns:
         List of parameter expression strings
     """
+    if '(' not in param_str:
+        result = param_str.split(',')
+        if not result[-1]:
+            result.pop()
+        return result
+    
     result = []
     current = []
     paren_depth = 0
@@ -304,6 +559,9 @@ def _split_params(param_str: str) -> List[str]:
     return result
 
 
+_PREDECESSOR_RE = re.compile(r'([A-Za-z])\(([^)]*)\)')
+
+
 def parse_production_string(prod_str: str) -> Production:
     """
     Parse a production from ABOP-style string notation.
@@ -360,7 +618,7 @@ def parse_production_string(prod_str: str) -> Production:
         right_context = ctx_parts[1].strip()
     
     # Parse predecessor with parameters
-    pred_match = re.match(r'([A-Za-z])\(([^)]*)\)', pred_part.strip())
+    pred_match = _PREDECESSOR_RE.match(pred_part.strip())
     if pred_match:
         predecessor = pred_match.group(1)
         param_str = pred_match.group(2).strip()
@@ -477,6 +735,19 @@ class ParametricLSystem:
             if prod.predecessor not in self._prod_index:
                 self._prod_index[prod.predecessor] = []
             self._prod_index[prod.predecessor].append(prod)
+        
+        # Context neighbors are only looked up for these predecessors
+        self._context_symbols = frozenset(
+            prod.predecessor for prod in self.productions
+            if prod.left_context or prod.right_context
+        )
+        
+        # Running probability totals per predecessor for binary-search selection
+        self._cumulative: Dict[str, Tuple[float, ...]] = {
+            symbol: tuple(accumulate(p.probability for p in prods))
+            for symbol, prods in self._prod_index.items()
+            if len(prods) > 1
+        }
     
     def _get_matching_productions(
         self, 
@@ -534,6 +805,13 @@ class ParametricLSystem:
         if len(matches) == 1:
             return matches[0]
         
+        symbol = matches[0][0].predecessor
+        if len(matches) == len(self._prod_index[symbol]):
+            # Every candidate matched: bisect the precomputed running totals
+            cumulative = self._cumulative[symbol]
+            i = bisect_left(cumulative, random.random() * cumulative[-1])
+            return matches[min(i, len(matches) - 1)]
+        
         # Weighted random selection
         total = sum(p.probability for p, _ in matches)
         r = random.random() * total
@@ -586,13 +864,34 @@ class ParametricLSystem:
             iterations = self.iterations
         
         current = list(self.axiom)
+        prod_index = self._prod_index
+        context_symbols = self._context_symbols
+        # Modules before `settled` have no productions and can never change,
+        # so tail-recursive growth only rewrites the active tail each step
+        settled = 0
         
         for step in range(iterations):
-            next_modules = []
+            length = len(current)
+            while settled < length and current[settled].symbol not in prod_index:
+                settled += 1
+            if settled == length:
+                break
+            next_modules = current[:settled]
+            append = next_modules.append
             
-            for i, module in enumerate(current):
+            for i in range(settled, length):
+                module = current[i]
+                symbol = module.symbol
+                if symbol not in prod_index:
+                    # No production for this symbol - module persists
+                    append(module)
+                    continue
+                
                 # Get context for context-sensitive matching
-                left, right = self._get_context_neighbors(current, i)
+                if symbol in context_symbols:
+                    left, right = self._get_context_neighbors(current, i)
+                else:
+                    left = right = None
                 
                 matches = self._get_matching_productions(module, left, right)
                 selected = self._select_production(matches)
@@ -602,7 +901,7 @@ class ParametricLSystem:
                     next_modules.extend(prod.apply(params, self.constants))
                 else:
                     # No matching production - module persists
-                    next_modules.append(module)
+                    append(module)
                 
                 if len(next_modules) > self.MAX_MODULES:
                     raise ParametricLSystemError(
@@ -610,6 +909,11 @@ class ParametricLSystem:
                         "Try reducing iterations."
                     )
             
+            if len(next_modules) > self.MAX_MODULES:
+                raise ParametricLSystemError(
+                    f"Exceeded max modules ({self.MAX_MODULES}). "
+                    "Try reducing iterations."
+                )
             current = next_modules
         
         return current
@@ -15,9 +15,49 @@ Contains:
 - Fractals (dragon, hilbert)
 
 All presets are production-ready with proper 3D operators and leaves where needed.
+
+The tables are kept as Python literals rather than a data file: the
+compiled module is cached in __pycache__, and executing its bytecode is
+faster than decoding the same table from JSON. The 3D and parametric
+tables live in _presets_3d.py and _presets_parametric.py and are only
+imported on first use.
 """
 
-from typing import Dict, Any
+import hashlib
+import math
+import os
+import re
+import sys
+import tempfile
+import threading
+from array import array
+from collections import ChainMap, defaultdict
+from functools import lru_cache
+from itertools import chain, islice
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
+
+from lsystem.engine import LSystem, LSystemError, make_rewriter
+from lsystem.parametric import Module, ParametricLSystem, Production, parse_production_string
+
+# Turtle symbol with an optional numeric argument, e.g. "F(50)" or "/(137.5)"
+_TOKEN_RE = re.compile(r"""([A-Za-z!&^/\\|+\-\[\]$'"{}])(?:\(([-\d.]+)\))?""")
+
+# Shared immutable tropism vectors - most presets bend toward gravity
+_TROPISM_DOWN = (0.0, -1.0, 0.0)
+_TROPISM_WINDSWEPT = (-0.61, -0.77, -0.19)
+_VECTOR_POOL: Dict[tuple, tuple] = {
+    _TROPISM_DOWN: _TROPISM_DOWN,
+    _TROPISM_WINDSWEPT: _TROPISM_WINDSWEPT,
+}
+
+# Hexagonal leaf polygon shared by the leafy tree presets, so the leaf
+# geometry is defined in one place
+_LEAF_HEX = "['''&&&{-f+f+f-|-f+f+f}]"
+_LEAF_HEX_UP = "['''^^{-f+f+f-|-f+f+f}]"   # pitched up instead of down
+_LEAF_QUAD = "[{-f+f-f-f}]"                  # flat four-sided leaf
+_LEAF_NEEDLE = "['''&&&{-f+f}]"               # narrow conifer needle
 
 # =============================================================================
 # 2D PRESETS - ABOP Classics
@@ -152,1232 +192,521 @@ PRESETS_2D: Dict[str, Dict[str, Any]] = {
 }
 
 # =============================================================================
-# 3D PRESETS - Trees with Leaves
+# Preset Post-Processing
 # =============================================================================
 
-PRESETS_3D: Dict[str, Dict[str, Any]] = {
-    # =========================================================================
-    # ABOP 3D - THE BEST!
-    # =========================================================================
-    "abop_1_25": {
-        "axiom": "A",
-        "rules": {
-            "A": "[&FLA]/////'[&FLA]/////'[&FLA]",
-            "F": "S/////F",
-            "S": "FL",
-            "L": "['''^^{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 22.5,
-        "iterations": 8,
-        "is_3d": True,
-        "render_polygons": True,
-        "width_decay": 0.9,
-        "growth_mode": "sigmoid",
-        "description": "ABOP 1.25 - Bush with hexagonal leaves - THE BEST [BEST]"
-    },
-    
-    "abop_1_26": {
-        "axiom": "A",
-        "rules": {
-            "A": "[&FPLA]/////'[&FPLA]/////'[&FPLA]",
-            "P": "F[++L][--L]",
-            "L": "[{-f+f-f-f}]",
-            "F": "FF"
-        },
-        "angle": 18,
-        "iterations": 6,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "ABOP 1.26 - Flowering plant with petals"
-    },
-    
-    # =========================================================================
-    # Tropism Demo
-    # =========================================================================
-    "tree_gravity_0_none": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.85)F(80)[&(25)$B][/(137.5)&(25)$B][/(275)&(25)$B]/(45)A",
-            "B": "!(0.75)F(60)[+(30)$C][-(30)$C]/(137.5)B",
-            "C": "!(0.65)F(40)L",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 30,
-        "iterations": 5,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.0,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "Tropism comparison - NO gravity (0.0)"
-    },
-    
-    "tree_gravity_1_moderate": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.85)F(80)[&(25)$B][/(137.5)&(25)$B][/(275)&(25)$B]/(45)A",
-            "B": "!(0.75)F(60)[+(30)$C][-(30)$C]/(137.5)B",
-            "C": "!(0.65)F(40)L",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 30,
-        "iterations": 5,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.15,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "Tropism comparison - MODERATE gravity (0.15)"
-    },
-    
-    "tree_gravity_2_strong": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.85)F(80)[&(25)$B][/(137.5)&(25)$B][/(275)&(25)$B]/(45)A",
-            "B": "!(0.75)F(60)[+(30)$C][-(30)$C]/(137.5)B",
-            "C": "!(0.65)F(40)L",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 30,
-        "iterations": 5,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.35,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "Tropism comparison - STRONG gravity (0.35) [BEST]"
-    },
-    
-    # =========================================================================
-    # ABOP Figure 2.7 - Sympodial Trees (Aono & Kunii)
-    # Research-validated parameters from Table 2.2
-    # Uses Leonardo's rule: width_decay = 0.707 (sqrt(2)^-1)
-    # =========================================================================
-    "sympodial_2_7a": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.707)F(50)[&(5)$B][/(180)&(65)$B]",
-            "B": "!(0.707)F(45)[&(5)$B][/(180)&(65)$B]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 35,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.08,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.7a - Tight main branch (a1=5, a2=65)"
-    },
-    
-    "sympodial_2_7b": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.707)F(50)[&(10)$B][/(180)&(60)$B]",
-            "B": "!(0.707)F(45)[&(10)$B][/(180)&(60)$B]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 35,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.10,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.7b - Moderate spread (a1=10, a2=60)"
-    },
-    
-    "sympodial_2_7c": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.707)F(50)[&(20)$B][/(180)&(50)$B]",
-            "B": "!(0.707)F(45)[&(20)$B][/(180)&(50)$B]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 35,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.12,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.7c - Balanced crown (a1=20, a2=50)"
-    },
-    
-    "sympodial_2_7d": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.707)F(50)[&(35)$BL][/(180)&(35)$BL]",
-            "B": "!(0.707)F(45)[&(35)$BL][/(180)&(35)$BL]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 35,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.14,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.7d - SYMMETRIC (a1=a2=35) [BEST]"
-    },
-    
-    # =========================================================================
-    # ABOP Figure 2.8 - Ternary Branching Trees
-    # Research-validated parameters from Table 2.3
-    # Uses da Vinci's rule: width_decay = 1.732 (sqrt(3)) for ternary
-    # =========================================================================
-    "ternary_2_8a": {
-        "axiom": "!(1)F(200)/(45)A",
-        "rules": {
-            "A": "!(1.732)F(50)[&(19)$B]/(94.74)[&(19)$B]/(132.63)[&(19)$B]",
-            "B": "!(1.732)F(45)[&(19)$B]/(94.74)[&(19)$B]/(132.63)[&(19)$B]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 20,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.22,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.8a - Conifer angles (d1=94.74, d2=132.63)"
-    },
-    
-    "ternary_2_8b": {
-        "axiom": "!(1)F(200)/(45)A",
-        "rules": {
-            "A": "!(1.732)F(50)[&(22)$BL]/(137.5)[&(22)$BL]/(137.5)[&(22)$BL]",
-            "B": "!(1.732)F(45)[&(22)$BL]/(137.5)[&(22)$BL]/(137.5)[&(22)$BL]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 20,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.14,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.8b - Golden angle whorls (137.5) [BEST]"
-    },
-    
-    "ternary_2_8c": {
-        "axiom": "!(1)F(200)/(45)A",
-        "rules": {
-            "A": "!(1.732)F(60)[&(25)$B]/(120)[&(25)$B]/(120)[&(25)$B]",
-            "B": "!(1.732)F(55)[&(25)$B]/(120)[&(25)$B]/(120)[&(25)$B]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 20,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.27,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.8c - Spreading (lr=1.79 high elongation)"
-    },
-    
-    "ternary_2_8d": {
-        "axiom": "!(1)F(200)/(45)A",
-        "rules": {
-            "A": "!(1.732)F(50)[&(18)$BL]/(100)[&(22)$BL]/(140)[&(15)$BL]",
-            "B": "!(1.732)F(45)[&(18)$BL]/(100)[&(22)$BL]/(140)[&(15)$BL]",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 20,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.40,
-        "tropism_direction": [-0.61, -0.77, -0.19],
-        "growth_mode": "sigmoid",
-        "description": "ABOP 2.8d - Windswept asymmetric tropism"
-    },
-    
-    # =========================================================================
-    # Honda's Models - Research Validated
-    # =========================================================================
-    # NOTE: honda_realistic moved to PARAMETRIC_PRESETS as "honda_param"
-    # The original here was broken (used static values instead of recursive contraction)
-    
-    # =========================================================================
-    # Simple Trees - Basic static versions for quick testing
-    # For true ABOP accuracy, use the parametric versions in PARAMETRIC_PRESETS
-    # =========================================================================
-    "oak_simple": {
-        "axiom": "F",
-        "rules": {
-            "F": "FF[&F][/&F][//&F][///&F]"
-        },
-        "angle": 30,
-        "iterations": 5,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.12,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "Simple oak-like branching (use oak_param for realistic)"
-    },
-    
-    # =========================================================================
-    # Stochastic Trees - Organic Variation
-    # =========================================================================
-    "stochastic_tree_3d": {
-        "axiom": "!(1)F(200)A",
-        "rules": {
-            "A": "!(0.707)F(50)[&(35)$BL][/(137.5)&(35)$BL]/(137.5)A",
-            "B": "!(0.707)F(40)[+(30)$CL][-(30)$CL]",
-            "C": "!(0.707)F(30)L",
-            "L": "['''&&&{-f+f+f-|-f+f+f}]"
-        },
-        "angle": 30,
-        "iterations": 8,
-        "is_3d": True,
-        "render_polygons": True,
-        "tropism_strength": 0.12,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "Stochastic 3D tree - organic variation"
-    },
-    
-    "stochastic_conifer": {
-        "axiom": "!(1)F(300)/(45)A",
-        "rules": {
-            "A": "!(1.732)F(50)[&(20)$B]/(120)[&(22)$B]/(120)[&(18)$B]/(45)A",
-            "B": "!(1.732)F(45)[&(20)$B]/(120)[&(22)$B]/(120)[&(18)$B]",
-            "L": "['''&&&{-f+f}]"
-        },
-        "angle": 20,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "tropism_strength": 0.15,
-        "tropism_direction": [0, -1, 0],
-        "growth_mode": "sigmoid",
-        "description": "Stochastic conifer - varied whorls"
-    },
-}
+# (rule, probability) -> Production, shared by every preset using that rule
+_PRODUCTION_INTERN: Dict[tuple, Production] = {}
 
-# =============================================================================
-# PARAMETRIC PRESETS
-# =============================================================================
 
-PARAMETRIC_PRESETS: Dict[str, Dict[str, Any]] = {
-    # =========================================================================
-    # Parametric Trees - FIXED 3D
-    # =========================================================================
-    "monopodial_tree": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)/(45)A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(45)B(l*0.6,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.6,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.6,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 45,
-        "iterations": 11,
-        "tropism_strength": 0.08,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "ABOP Fig 2.6 - Monopodial (FIXED 3D with roll) [BEST]"
-    },
-    
-    "ternary_tree": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)/(45)A",
-        "productions": [
-            "A -> !(1.732)F(50)[&(19)F(50)B]/(94.74)[&(19)F(50)B]/(132.63)[&(19)F(50)B]",
-            "B -> !(1.732)F(50)[&(19)F(50)B]/(94.74)[&(19)F(50)B]/(132.63)[&(19)F(50)B]",
-            "F(l) -> F(l*1.109)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {
-            "b": 94.74,
-            "c": 19,
-            "d": 1.109,
-            "h": 1.732
-        },
-        "angle": 20,
-        "iterations": 9,
-        "tropism_strength": 0.15,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "ABOP Fig 2.8 - Ternary (FIXED 3D whorls) [BEST]"
-    },
-    
-    # =========================================================================
-    # Parametric Sympodial Variants (ABOP 2.7)
-    # =========================================================================
-    "sympodial_param_a": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)A(50,10)",
-        "productions": [
-            "A(l,w) -> !(w*0.707)F(l)[&(5)$B(l*0.9,w*0.707)]/(180)[&(65)$B(l*0.8,w*0.707)]",
-            "B(l,w) -> !(w*0.707)F(l)[&(5)$B(l*0.9,w*0.707)]/(180)[&(65)$B(l*0.8,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 10,
-        "tropism_strength": 0.08,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "Sympodial parametric a1=5, a2=65"
-    },
-    
-    "sympodial_param_b": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)A(50,10)",
-        "productions": [
-            "A(l,w) -> !(w*0.707)F(l)[&(10)$B(l*0.9,w*0.707)]/(180)[&(60)$B(l*0.8,w*0.707)]",
-            "B(l,w) -> !(w*0.707)F(l)[&(10)$B(l*0.9,w*0.707)]/(180)[&(60)$B(l*0.8,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 10,
-        "tropism_strength": 0.10,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "Sympodial parametric a1=10, a2=60"
-    },
-    
-    "sympodial_param_c": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)A(50,10)",
-        "productions": [
-            "A(l,w) -> !(w*0.707)F(l)[&(20)$B(l*0.9,w*0.707)]/(180)[&(50)$B(l*0.8,w*0.707)]",
-            "B(l,w) -> !(w*0.707)F(l)[&(20)$B(l*0.9,w*0.707)]/(180)[&(50)$B(l*0.8,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 10,
-        "tropism_strength": 0.12,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "Sympodial parametric a1=20, a2=50"
-    },
-    
-    "sympodial_param_d": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)A(50,10)",
-        "productions": [
-            "A(l,w) -> !(w*0.707)F(l)[&(35)$B(l*0.9,w*0.707)L]/(180)[&(35)$B(l*0.8,w*0.707)L]",
-            "B(l,w) -> !(w*0.707)F(l)[&(35)$B(l*0.9,w*0.707)L]/(180)[&(35)$B(l*0.8,w*0.707)L]",
-            "L -> ['''&&&{-f+f+f-|-f+f+f}]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 10,
-        "tropism_strength": 0.14,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Sympodial parametric SYMMETRIC a1=a2=35 [BEST]"
-    },
-    
-    # =========================================================================
-    # Parametric Ternary Variants (ABOP 2.8)
-    # =========================================================================
-    "ternary_param_a": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)/(45)A(50)",
-        "productions": [
-            "A(l) -> !(1.732)F(l)[&(19)$B(l*0.9)]/(94.74)[&(19)$B(l*0.9)]/(132.63)[&(19)$B(l*0.9)]",
-            "B(l) -> !(1.732)F(l)[&(19)$B(l*0.9)]/(94.74)[&(19)$B(l*0.9)]/(132.63)[&(19)$B(l*0.9)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 20,
-        "iterations": 7,
-        "tropism_strength": 0.22,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "Ternary parametric d1=94.74, d2=132.63"
-    },
-    
-    "ternary_param_b": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)/(45)A(50)",
-        "productions": [
-            "A(l) -> !(1.732)F(l)[&(22)$B(l*0.9)L]/(137.5)[&(22)$B(l*0.9)L]/(137.5)[&(22)$B(l*0.9)L]",
-            "B(l) -> !(1.732)F(l)[&(22)$B(l*0.9)L]/(137.5)[&(22)$B(l*0.9)L]/(137.5)[&(22)$B(l*0.9)L]",
-            "L -> ['''&&&{-f+f+f-|-f+f+f}]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 20,
-        "iterations": 7,
-        "tropism_strength": 0.14,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Ternary parametric golden angle 137.5 [BEST]"
-    },
-    
-    "ternary_param_c": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)/(45)A(60)",
-        "productions": [
-            "A(l) -> !(1.732)F(l)[&(25)$B(l*1.1)]/(120)[&(25)$B(l*1.1)]/(120)[&(25)$B(l*1.1)]",
-            "B(l) -> !(1.732)F(l)[&(25)$B(l*1.1)]/(120)[&(25)$B(l*1.1)]/(120)[&(25)$B(l*1.1)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 20,
-        "iterations": 6,
-        "tropism_strength": 0.27,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "growth_mode": "sigmoid",
-        "description": "Ternary parametric spreading lr=1.79"
-    },
-    
-    "ternary_param_d": {
-        "type": "parametric",
-        "axiom": "!(1)F(200)/(45)A(50)",
-        "productions": [
-            "A(l) -> !(1.732)F(l)[&(18)$B(l*0.95)L]/(100)[&(22)$B(l*0.95)L]/(140)[&(15)$B(l*0.95)L]",
-            "B(l) -> !(1.732)F(l)[&(18)$B(l*0.95)L]/(100)[&(22)$B(l*0.95)L]/(140)[&(15)$B(l*0.95)L]",
-            "L -> ['''&&&{-f+f+f-|-f+f+f}]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 20,
-        "iterations": 7,
-        "tropism_strength": 0.40,
-        "tropism_direction": [-0.61, -0.77, -0.19],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Ternary parametric windswept asymmetric"
-    },
-    
-    # =========================================================================
-    # Parametric Honda/Realistic Species Trees (ABOP-accurate)
-    # These use TRUE recursive contraction for realistic tree shapes
-    # =========================================================================
-    # =========================================================================
-    # SYMMETRIC Honda Trees with TINY GREEN LEAVES ON ALL BRANCHES
-    # Using f(0.02) for very small leaf polygons
-    # =========================================================================
-    
-    "honda_symmetric_3": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l*0.3)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(45)$B(l*0.8,w*0.707)][+(45)$B(l*0.8,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Honda SYMMETRIC 3-way - TINY green leaves [BEST]"
-    },
-    
-    "honda_symmetric_4": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l*0.3)[&(50)B(l*0.75,w*0.707)]/(90)[&(50)B(l*0.75,w*0.707)]/(90)[&(50)B(l*0.75,w*0.707)]/(90)[&(50)B(l*0.75,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(40)$B(l*0.8,w*0.707)][+(40)$B(l*0.8,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 6,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Honda SYMMETRIC 4-way - TINY green leaves"
-    },
-    
-    "honda_symmetric_5": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l*0.3)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]/(72)[&(35)B(l*0.7,w*0.707)]F(l*0.7)A(l*0.92,w*0.85)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.015)+f(0.015)-|-f(0.015)+f(0.015)}][-(30)$B(l*0.75,w*0.707)][+(30)$B(l*0.75,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 6,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Honda SYMMETRIC 5-way pine - TINY green needles"
-    },
-    
-    "honda_symmetric_full": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l*0.3)[&(55)B(l*0.9,w*0.707)]/(120)[&(55)B(l*0.9,w*0.707)]/(120)[&(55)B(l*0.9,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(50)$B(l*0.9,w*0.707)][+(50)$B(l*0.9,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Honda SYMMETRIC FULL - TINY dense green leaves [BEST]"
-    },
-    
-    "honda_symmetric_weeping": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l*0.3)[&(55)B(l*0.85,w*0.707)]/(120)[&(55)B(l*0.85,w*0.707)]/(120)[&(55)B(l*0.85,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.02)+f(0.02)-|-f(0.02)+f(0.02)}][-(45)$B(l*0.9,w*0.707)][+(45)$B(l*0.9,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 7,
-        "tropism_strength": 0.40,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Honda SYMMETRIC WEEPING - TINY leaves + gravity [BEST]"
-    },
-    
-    "honda_symmetric_bare": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l*0.3)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]/(120)[&(45)B(l*0.8,w*0.707)]F(l*0.7)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$B(l*0.8,w*0.707)][+(45)$B(l*0.8,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 45,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda SYMMETRIC bare branches (no leaves)"
-    },
-    
-    # =========================================================================
-    # CREATIVE STYLIZED PLANTS - Visually Interesting
-    # =========================================================================
-    
-    # --- UMBRELLA TREE ---
-    # Flat spreading canopy like an acacia
-    "umbrella_tree": {
-        "type": "parametric",
-        "axiom": "!(10)F(1)A(0.5,6)",
-        "productions": [
-            # Tall trunk, then spreading flat branches at top
-            "A(l,w) -> !(w)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]/(60)[&(85)B(l,w*0.7)]",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.008)+f(0.008)-|-f(0.008)+f(0.008)}][+(20)B(l*0.7,w*0.8)][-(20)B(l*0.7,w*0.8)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 6,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Umbrella/Acacia tree - flat spreading canopy"
-    },
-    
-    # --- CORAL BRANCH ---
-    # Dense branching coral-like structure
-    "coral_branch": {
-        "type": "parametric",
-        "axiom": "A(1,8)",
-        "productions": [
-            # Bifurcating branches with slight randomness feel
-            "A(l,w) -> !(w)F(l)[+(30)&(20)A(l*0.75,w*0.75)][-(30)&(20)A(l*0.75,w*0.75)][&(40)A(l*0.6,w*0.7)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 30,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Coral branch - dense bifurcating structure"
-    },
-    
-    # --- FLOWERING BURST ---
-    # Plant with colorful flower at branch tips
-    "flowering_burst": {
-        "type": "parametric",
-        "axiom": "!(8)F(0.5)A(0.4,5)",
-        "productions": [
-            # Main branching structure
-            "A(l,w) -> !(w)F(l)[&(45)B(l*0.7,w*0.707)]/(90)[&(50)B(l*0.7,w*0.707)]/(90)[&(45)B(l*0.7,w*0.707)]/(90)[&(50)B(l*0.7,w*0.707)]F(l*0.5)A(l*0.8,w*0.707)",
-            # Branches with flowers (pink/red) at tips
-            "B(l,w) : l > 0.1 -> !(w)F(l)[-(40)B(l*0.7,w*0.75)][+(40)B(l*0.7,w*0.75)]",
-            "B(l,w) : l <= 0.1 -> !(w)F(l)[''''^^{-f(0.008)+f(0.008)+f(0.008)-|-f(0.008)+f(0.008)+f(0.008)}]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Flowering burst - pink flowers at branch tips"
-    },
-    
-    # --- TWISTED BONSAI ---
-    # Asymmetric windswept bonsai style
-    "twisted_bonsai": {
-        "type": "parametric",
-        "axiom": "!(10)&(10)/(20)F(0.8)A(0.5,6)",
-        "productions": [
-            # Asymmetric branching with strong bias to one side
-            "A(l,w) -> !(w)F(l)[&(60)/(30)B(l*0.8,w*0.707)][&(40)/(-60)B(l*0.5,w*0.6)]/(80)A(l*0.85,w*0.75)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.008)+f(0.008)-|-f(0.008)+f(0.008)}][&(35)B(l*0.7,w*0.707)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 7,
-        "tropism_strength": 0.15,
-        "tropism_direction": [0.3, -1, 0.1],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Twisted bonsai - asymmetric windswept style"
-    },
-    
-    # --- PALM FROND ---
-    # Fan-like palm with long fronds
-    "palm_fan": {
-        "type": "parametric",
-        "axiom": "!(12)F(1.2)A(0.8,8)",
-        "productions": [
-            # Crown of fronds spreading outward
-            "A(l,w) -> [&(70)B(l,w*0.3)]/(51.4)[&(65)B(l,w*0.3)]/(51.4)[&(75)B(l,w*0.3)]/(51.4)[&(60)B(l,w*0.3)]/(51.4)[&(70)B(l,w*0.3)]/(51.4)[&(65)B(l,w*0.3)]/(51.4)[&(75)B(l,w*0.3)]",
-            # Each frond with leaflets along its length
-            "B(l,w) -> !(w)F(l*0.3)[''''''''+(60){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}][''''''''-(60){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}]F(l*0.25)[''''''''+(55){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}][''''''''-(55){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}]F(l*0.2)[''''''''+(50){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}][''''''''-(50){-f(0.005)+f(0.005)-|-f(0.005)+f(0.005)}]F(l*0.15)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 3,
-        "tropism_strength": 0.25,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Palm fan - tropical palm with drooping fronds"
-    },
-    
-    # --- CRYSTAL TREE ---
-    # Geometric crystalline branching structure
-    "crystal_tree": {
-        "type": "parametric",
-        "axiom": "!(8)F(0.6)A(0.5,6)",
-        "productions": [
-            # 6-way symmetric branching like ice crystals
-            "A(l,w) -> !(w)F(l)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]/(60)[&(60)B(l*0.6,w*0.7)]A(l*0.7,w*0.8)",
-            "B(l,w) -> !(w)F(l)[&(60)B(l*0.5,w*0.7)][^(60)B(l*0.5,w*0.7)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 60,
-        "iterations": 5,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "linear",
-        "description": "Crystal tree - 6-way symmetric geometric branching"
-    },
-    
-    # --- VINE SPIRAL ---
-    # Climbing vine that spirals upward
-    "vine_spiral": {
-        "type": "parametric",
-        "axiom": "A(1,5)",
-        "productions": [
-            # Spiral climb with leaves at each node
-            "A(l,w) -> !(w)F(l*0.15)[''''''''&(70){-f(0.008)+f(0.008)-|-f(0.008)+f(0.008)}]/(90)&(5)A(l*0.98,w*0.98)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 35,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "linear",
-        "description": "Vine spiral - climbing spiral with leaves"
-    },
-    
-    # --- FERN UNFURL ---
-    # Fern frond with curled tip (fiddlehead)
-    "fern_unfurl": {
-        "type": "parametric",
-        "axiom": "!(6)&(15)A(0.8,5)",
-        "productions": [
-            # Main rachis with pinnae, curling at tip
-            "A(l,w) -> !(w)F(l*0.12)[''''''''+(70){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}][''''''''-(70){-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}]^(8)A(l*0.94,w*0.95)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 30,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Fern unfurl - curling fiddlehead frond"
-    },
-    
-    # --- EXPLOSION BUSH ---  
-    # Dramatic radiating growth from center
-    "explosion_bush": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            # Multiple branches exploding outward at each level
-            "A(l,w) -> !(w)F(l*0.2)[&(30)B(l*0.9,w*0.65)]/(72)[&(35)B(l*0.85,w*0.65)]/(72)[&(30)B(l*0.9,w*0.65)]/(72)[&(35)B(l*0.85,w*0.65)]/(72)[&(30)B(l*0.9,w*0.65)]A(l*0.7,w*0.707)",
-            "B(l,w) -> !(w)F(l)[''''''''^^{-f(0.006)+f(0.006)-|-f(0.006)+f(0.006)}][&(25)B(l*0.75,w*0.707)][/(90)&(25)B(l*0.7,w*0.65)]"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 6,
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "apical",
-        "description": "Explosion bush - dramatic radiating growth"
-    },
-    
-    # --- WEEPING CANOPY ---
-    # Dense drooping branches like a weeping willow
-    "weeping_canopy": {
-        "type": "parametric",
-        "axiom": "!(12)F(0.8)A(0.6,8)",
-        "productions": [
-            # Umbrella of drooping branches
-            "A(l,w) -> !(w)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]/(45)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]/(45)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]/(45)[&(70)B(l,w*0.5)]/(45)[&(65)B(l,w*0.5)]",
-            # Long trailing branches with small leaves
-            "B(l,w) -> !(w)F(l*0.15)[''''''''^^{-f(0.004)+f(0.004)-|-f(0.004)+f(0.004)}]B(l*0.92,w*0.9)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 22.5,
-        "iterations": 12,
-        "tropism_strength": 0.5,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Weeping canopy - dense drooping willow style"
-    },
-    
-    # =========================================================================
-    # ABOP Figure 2.6 - Honda's Original SPIRAL Trees (for reference)
-    # These have the characteristic spiral phyllotaxis pattern
-    # =========================================================================
-    
-    "honda_2_6a": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(45)B(l*0.6,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.6,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.6,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {"r1": 0.9, "r2": 0.6, "a0": 45, "a2": 45, "d": 137.5, "wr": 0.707},
-        "angle": 45,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "ABOP Fig 2.6a - Excurrent/conifer SPIRAL (r1=0.9, r2=0.6)"
-    },
-    
-    "honda_2_6b": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(45)B(l*0.9,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.9,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.9,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {"r1": 0.9, "r2": 0.9, "a0": 45, "a2": 45, "d": 137.5, "wr": 0.707},
-        "angle": 45,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "ABOP Fig 2.6b - Decurrent/deciduous SPIRAL (r1=0.9, r2=0.9)"
-    },
-    
-    "honda_2_6c": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(45)B(l*0.8,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.8,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.8,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {"r1": 0.9, "r2": 0.8, "a0": 45, "a2": 45, "d": 137.5, "wr": 0.707},
-        "angle": 45,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "ABOP Fig 2.6c - Intermediate SPIRAL (r1=0.9, r2=0.8)"
-    },
-    
-    "honda_2_6d": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(30)B(l*0.7,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(-30)$C(l*0.7,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(-30)$B(l*0.7,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {"r1": 0.9, "r2": 0.7, "a0": 30, "a2": -30, "d": 137.5, "wr": 0.707},
-        "angle": 30,
-        "iterations": 10,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "ABOP Fig 2.6d - Narrow columnar SPIRAL (r1=0.9, r2=0.7)"
-    },
-    
-    # =========================================================================
-    # WHORLED Honda Variants - Multiple branches per level (NO spiral look)
-    # These look more like traditional "tree" silhouettes
-    # =========================================================================
-    
-    "honda_whorled_3": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(45)B(l*0.8,w*0.707)][/(120)&(45)B(l*0.8,w*0.707)][/(240)&(45)B(l*0.8,w*0.707)]/(45)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.8,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.8,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 45,
-        "iterations": 8,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda 3-WHORLED - 3 branches per level (no spiral) [BEST]"
-    },
-    
-    "honda_whorled_4": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(50)B(l*0.75,w*0.707)][/(90)&(50)B(l*0.75,w*0.707)][/(180)&(50)B(l*0.75,w*0.707)][/(270)&(50)B(l*0.75,w*0.707)]/(45)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(40)$C(l*0.8,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(40)$B(l*0.8,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 45,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda 4-WHORLED - 4 branches per level, spreading crown"
-    },
-    
-    "honda_whorled_5": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(35)B(l*0.7,w*0.707)][/(72)&(35)B(l*0.7,w*0.707)][/(144)&(35)B(l*0.7,w*0.707)][/(216)&(35)B(l*0.7,w*0.707)][/(288)&(35)B(l*0.7,w*0.707)]/(36)A(l*0.92,w*0.85)",
-            "B(l,w) -> !(w)F(l)[-(30)$C(l*0.75,w*0.707)]C(l*0.85,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(30)$B(l*0.75,w*0.707)]B(l*0.85,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 7,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda 5-WHORLED - conifer/pine style with 5 branches per level"
-    },
-    
-    "honda_whorled_full": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(55)B(l*0.9,w*0.707)][/(120)&(55)B(l*0.9,w*0.707)][/(240)&(55)B(l*0.9,w*0.707)]/(60)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(50)$C(l*0.9,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(50)$B(l*0.9,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 50,
-        "iterations": 8,
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda WHORLED FULL - very dense deciduous crown (r2=0.9) [BEST]"
-    },
-    
-    # =========================================================================
-    # Honda Variants with Tropism (for weeping/gravity effects)
-    # =========================================================================
-    
-    "honda_weeping": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(50)B(l*0.8,w*0.707)]/(137.5)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.85,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.85,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 45,
-        "iterations": 10,
-        "tropism_strength": 0.35,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda with strong gravity - weeping willow effect"
-    },
-    
-    "honda_whorled_weeping": {
-        "type": "parametric",
-        "axiom": "A(1,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(55)B(l*0.85,w*0.707)][/(120)&(55)B(l*0.85,w*0.707)][/(240)&(55)B(l*0.85,w*0.707)]/(60)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[-(45)$C(l*0.9,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) -> !(w)F(l)[+(45)$B(l*0.9,w*0.707)]B(l*0.9,w*0.707)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 50,
-        "iterations": 8,
-        "tropism_strength": 0.40,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Honda WHORLED WEEPING - full crown with gravity droop [BEST]"
-    },
-    
-    "oak_param": {
-        "type": "parametric",
-        "axiom": "!(12)F(250)A(60,8)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(45)$B(l*0.65,w*0.707)][/(90)&(50)$B(l*0.65,w*0.707)][/(180)&(45)$B(l*0.65,w*0.707)][/(270)&(50)$B(l*0.65,w*0.707)]/(45)A(l*0.85,w*0.707)",
-            "B(l,w) -> !(w)F(l)[+(35)$C(l*0.7,w*0.707)][-(35)$C(l*0.7,w*0.707)]/(137.5)B(l*0.8,w*0.707)",
-            "C(l,w) : l > 5 -> !(w)F(l)[&(30)$C(l*0.6,w*0.707)]",
-            "C(l,w) : l <= 5 -> !(w)F(l)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 7,
-        "tropism_strength": 0.12,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Oak - spreading crown with 4-way whorls (parametric)"
-    },
-    
-    "elm_param": {
-        "type": "parametric",
-        "axiom": "!(12)F(300)A(55,9)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(55)$B(l*0.7,w*0.707)][/(90)&(60)$B(l*0.65,w*0.707)][/(180)&(55)$B(l*0.7,w*0.707)][/(270)&(60)$B(l*0.65,w*0.707)]/(60)A(l*0.9,w*0.707)",
-            "B(l,w) -> !(w)F(l)[&(40)$C(l*0.65,w*0.707)][/(180)&(40)$C(l*0.65,w*0.707)]/(137.5)B(l*0.85,w*0.707)",
-            "C(l,w) : l > 8 -> !(w)F(l)[&(35)$C(l*0.6,w*0.707)]",
-            "C(l,w) : l <= 8 -> !(w)F(l)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 30,
-        "iterations": 7,
-        "tropism_strength": 0.10,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Elm - vase-shaped crown (parametric)"
-    },
-    
-    "willow_param": {
-        "type": "parametric",
-        "axiom": "!(12)F(200)A(70,8)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(60)$B(l*0.8,w*0.707)][/(90)&(70)$B(l*0.75,w*0.707)][/(180)&(60)$B(l*0.8,w*0.707)][/(270)&(70)$B(l*0.75,w*0.707)]/(137.5)A(l*0.85,w*0.707)",
-            "B(l,w) -> !(w)F(l)[&(40)$C(l*0.85,w*0.707)][/(180)&(40)$C(l*0.85,w*0.707)]C(l*0.9,w*0.707)",
-            "C(l,w) : l > 5 -> !(w)F(l)C(l*0.95,w*0.8)",
-            "C(l,w) : l <= 5 -> !(w)F(l)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 25,
-        "iterations": 6,
-        "tropism_strength": 0.45,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Willow - extreme droop with long trailing branches"
-    },
-    
-    "pine_param": {
-        "type": "parametric",
-        "axiom": "!(12)F(250)/(45)A(40,8)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(25)$B(l*0.5,w*0.707)][/(72)&(25)$B(l*0.5,w*0.707)][/(144)&(25)$B(l*0.5,w*0.707)][/(216)&(25)$B(l*0.5,w*0.707)][/(288)&(25)$B(l*0.5,w*0.707)]/(137.5)A(l*0.95,w*0.85)",
-            "B(l,w) -> !(w)F(l)[&(15)$C(l*0.7,w*0.707)]C(l*0.8,w*0.707)",
-            "C(l,w) : l > 8 -> !(w)F(l)C(l*0.85,w*0.707)",
-            "C(l,w) : l <= 8 -> !(w)F(l)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 25,
-        "iterations": 8,
-        "tropism_strength": 0.05,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Pine - 5-way whorled conical conifer"
-    },
-    
-    "spruce_param": {
-        "type": "parametric",
-        "axiom": "!(14)F(300)/(45)A(35,10)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(30)$B(l*0.45,w*0.707)][/(60)&(30)$B(l*0.45,w*0.707)][/(120)&(30)$B(l*0.45,w*0.707)][/(180)&(30)$B(l*0.45,w*0.707)][/(240)&(30)$B(l*0.45,w*0.707)][/(300)&(30)$B(l*0.45,w*0.707)]/(137.5)A(l*0.92,w*0.9)",
-            "B(l,w) -> !(w)F(l)[&(20)$C(l*0.6,w*0.707)]C(l*0.75,w*0.707)",
-            "C(l,w) : l > 6 -> !(w)F(l)C(l*0.8,w*0.707)",
-            "C(l,w) : l <= 6 -> !(w)F(l)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 20,
-        "iterations": 9,
-        "tropism_strength": 0.08,
-        "tropism_direction": [0, -1, 0],
-        "is_3d": True,
-        "render_polygons": False,
-        "growth_mode": "sigmoid",
-        "description": "Spruce - dense 6-way whorled Christmas tree shape"
-    },
-    
-    "bonsai_param": {
-        "type": "parametric",
-        "axiom": "!(8)F(150)&(15)/(30)A(50,6)",
-        "productions": [
-            "A(l,w) -> !(w)F(l)[&(50)$B(l*0.55,w*0.707)][/(120)&(60)$B(l*0.5,w*0.707)]/(200)A(l*0.7,w*0.707)",
-            "B(l,w) -> !(w)F(l)[+(40)$C(l*0.6,w*0.707)][-(50)$C(l*0.55,w*0.707)]",
-            "C(l,w) : l > 10 -> !(w)F(l)[&(35)$C(l*0.5,w*0.707)]",
-            "C(l,w) : l <= 10 -> !(w)F(l)"
-        ],
-        "rules": {"info": "Parametric - see 'productions'"},
-        "constants": {},
-        "angle": 35,
-        "iterations": 7,
-        "tropism_strength": 0.25,
-        "tropism_direction": [0.2, -1, 0.1],
-        "is_3d": True,
-        "render_polygons": True,
-        "growth_mode": "sigmoid",
-        "description": "Bonsai - asymmetric artistic windswept style"
-    },
-    
-    # =========================================================================
-    # Stochastic
-    # =========================================================================
-    "stochastic_plant": {
-        "type": "parametric",
-        "axiom": "F",
-        "productions": [
-            {"rule": "F -> F[-F]F[+F]F", "probability": 0.33},
-            {"rule": "F -> F[-F]F", "probability": 0.33},
-            {"rule": "F -> F[+F]F", "probability": 0.34}
-        ],
-        "rules": {"info": "Stochastic - see 'productions'"},
-        "angle": 28,
-        "iterations": 6,
-        "growth_mode": "sigmoid",
-        "description": "ABOP p.28 - Stochastic L-system with variation"
-    },
-}
+def _compile_productions(name: str, productions) -> tuple:
+    """
+    Build Production objects for a preset and precompile their expressions.
+    
+    Successor templates and conditions are tokenized and compiled when the
+    Production is built, so running the preset only evaluates code objects.
+    Presets that repeat a rule share one Production; treat them as read-only.
+    """
+    compiled = []
+    for prod in productions:
+        rule = prod['rule'] if isinstance(prod, dict) else prod
+        probability = prod.get('probability', 1.0) if isinstance(prod, dict) else 1.0
+        key = (rule, probability)
+        production = _PRODUCTION_INTERN.get(key)
+        if production is None:
+            try:
+                production = parse_production_string(rule)
+            except ValueError as e:
+                raise ValueError(f"Preset '{name}': {e}") from None
+            production.probability = probability
+            _PRODUCTION_INTERN[key] = production
+        compiled.append(production)
+    return tuple(compiled)
+
+
+def _tokenize(name: str, word: str) -> tuple:
+    """
+    Split a word into parallel symbol and argument arrays.
+    
+    Returns:
+        (ops, args): array('b') of symbol codes (ord) and array('f') of
+        arguments, NaN where a symbol has none
+    
+    Raises:
+        ValueError: If part of the word is not a symbol or argument
+    """
+    tokens = _TOKEN_RE.findall(word)
+    symbols = ''.join([symbol for symbol, _ in tokens])
+    values = [arg for _, arg in tokens if arg]
+    # Matches never overlap, so they cover the word iff their lengths add up
+    if len(symbols) + sum(map(len, values)) + 2 * len(values) != len(word):
+        end = 0
+        for match in _TOKEN_RE.finditer(word):
+            if match.start() != end:
+                break
+            end = match.end()
+        raise ValueError(f"Preset '{name}': cannot tokenize {word[end:]!r}")
+    ops = array('b', symbols.encode('ascii'))
+    args = array('f', [float(arg) if arg else math.nan for _, arg in tokens])
+    return ops, args
+
+
+def _canonical_vector(vector) -> tuple:
+    """Return the pooled tuple equal to a 3-component vector."""
+    key = tuple(float(c) for c in vector)
+    return _VECTOR_POOL.setdefault(key, key)
+
+
+def _intern_preset(entry: Dict[str, Any]):
+    """Intern axiom, rule and production strings so equal text is one object."""
+    entry['axiom'] = sys.intern(entry['axiom'])
+    if 'rules' in entry:
+        # Rebuilt in place so presets sharing a rules dict keep sharing it
+        rules = entry['rules']
+        interned = {
+            sys.intern(symbol): sys.intern(successor)
+            for symbol, successor in rules.items()
+        }
+        rules.clear()
+        rules.update(interned)
+    if 'productions' in entry:
+        productions = entry['productions']
+        for i, prod in enumerate(productions):
+            if isinstance(prod, dict):
+                prod['rule'] = sys.intern(prod['rule'])
+            else:
+                productions[i] = sys.intern(prod)
+
+
+# Preset name -> tuple of Production objects ready for ParametricLSystem
+_COMPILED_PRODUCTIONS: Dict[str, tuple] = {}
+
+
+def _compile_presets(table: Dict[str, Dict[str, Any]]):
+    """
+    Normalize every entry of a preset table once, when it is loaded.
+    
+    Lookup helpers can then read fields directly instead of re-applying
+    defaults on every call. Production strings are validated here so a
+    malformed preset fails on load rather than mid-render.
+    """
+    for name, entry in table.items():
+        _intern_preset(entry)
+        entry.setdefault('category', 'other')
+        if 'tropism_direction' in entry:
+            entry['tropism_direction'] = _canonical_vector(
+                entry['tropism_direction']
+            )
+        if 'productions' in entry:
+            if 'rules' not in entry:
+                # Text stand-in for callers that display every preset's rules
+                entry['rules'] = {'parametric': str(entry['productions'])}
+            _COMPILED_PRODUCTIONS[name] = _compile_productions(
+                name, entry['productions']
+            )
+
+
+_compile_presets(PRESETS_2D)
+
+
+# Lowercased name -> original key, one index per table
+_PRESET_INDEX_LOWER_2D = {name.lower(): name for name in PRESETS_2D}
+
+# Lowercased name -> preset as get_preset returns it; 2D only until _load()
+_PRESET_BY_LOWER = {lower: PRESETS_2D[key] for lower, key in _PRESET_INDEX_LOWER_2D.items()}
+
+# Sorted listings - the tables are static, so sort once
+_ALL_PRESETS_NO_3D_SORTED = tuple(sorted(PRESETS_2D))
+
+
+def _rebuild_category_index():
+    """
+    Rebuild the category -> preset names index.
+    
+    Only needed if a preset's category is changed after import.
+    """
+    global _CATEGORY_INDEX
+    categories = defaultdict(list)
+    for name, preset in chain(PRESETS_2D.items(), PRESETS_3D.items(),
+                              PARAMETRIC_PRESETS.items()):
+        categories[preset['category']].append(name)
+    _CATEGORY_INDEX = MappingProxyType(
+        {k: tuple(sorted(v)) for k, v in sorted(categories.items())}
+    )
+
+
+def _build_soa():
+    """
+    Build column-oriented copies of the scalar preset fields.
+    
+    Rows follow sorted preset name, so filters that scan one or two
+    columns return names already in listing order.
+    """
+    rows = sorted(
+        chain(
+            ((name, preset, False) for name, preset in PRESETS_2D.items()),
+            ((name, preset, True) for name, preset in PRESETS_3D.items()),
+            ((name, preset, False) for name, preset in PARAMETRIC_PRESETS.items()),
+        ),
+        key=lambda row: row[0],
+    )
+    return (
+        [name for name, _, _ in rows],
+        [preset['axiom'] for _, preset, _ in rows],
+        [preset['iterations'] for _, preset, _ in rows],
+        [preset['angle'] for _, preset, _ in rows],
+        [in_3d or bool(preset.get('is_3d')) for _, preset, in_3d in rows],
+        [bool(preset.get('render_polygons')) for _, preset, _ in rows],
+        [preset.get('growth_mode') for _, preset, _ in rows],
+    )
+
+
+def _expansion_key(axiom: str, rules: Dict[str, str], iterations: int) -> tuple:
+    """Key identifying an expansion: it depends only on axiom, rules and depth."""
+    return (sys.intern(axiom), frozenset(rules.items()), iterations)
+
+
+@lru_cache(maxsize=128)
+def _rewriter(rules: frozenset):
+    """Rule-specialized rewriter, shared by presets with identical rules."""
+    return make_rewriter(dict(rules))
+
+
+# Expansions at least this long are also kept on disk between runs
+_DISK_CACHE_MIN_LENGTH = 1 << 20
+
+
+def _disk_cache_dir() -> Path:
+    """Directory for cached expansions; LSYSTEM_CACHE_DIR overrides it."""
+    override = os.environ.get('LSYSTEM_CACHE_DIR')
+    if override:
+        return Path(override)
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return Path(base) / 'lsystem'
+
+
+def _disk_cache_path(axiom: str, rules: frozenset, iterations: int) -> Path:
+    """Cache file for an expansion key, named by a hash of the key."""
+    key = repr((axiom, sorted(rules), iterations)).encode('utf-8')
+    return _disk_cache_dir() / f"{hashlib.blake2b(key, digest_size=8).hexdigest()}.txt"
+
+
+def _write_disk_cache(path: Path, data: bytes):
+    """Write a cache file atomically; an unwritable cache is skipped."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=path.parent,
+                                         suffix='.tmp', delete=False) as f:
+            f.write(data)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=128)
+def _expand(axiom: str, rules: frozenset, iterations: int) -> str:
+    """
+    Expand an axiom; cached per expansion key (see _expansion_key).
+    
+    Long expansions are also cached on disk, so a later process reads the
+    string back instead of rewriting it again. The length is known before
+    rewriting, so short expansions never touch the disk and a cache file of
+    the wrong length (truncated or foreign) is rewritten.
+    """
+    rewrite = _rewriter(rules)
+    if rewrite is None:
+        return LSystem(axiom, dict(rules), iterations).generate()
+    length = rewrite.length(axiom, iterations)
+    if length < _DISK_CACHE_MIN_LENGTH:
+        return rewrite(axiom, iterations)
+    path = _disk_cache_path(axiom, rules, iterations)
+    try:
+        cached = path.read_text(encoding='ascii')
+        if len(cached) == length:
+            return cached
+    except (OSError, UnicodeDecodeError):
+        pass
+    expanded = rewrite(axiom, iterations)
+    _write_disk_cache(path, expanded.encode('ascii'))
+    return expanded
+
+
+# Derivations with at least this many modules are also kept on disk
+_DISK_CACHE_MIN_MODULES = 1 << 16
+
+# Deterministic parametric derivations by content digest, oldest first
+_DERIVATION_CACHE_SIZE = 32
+_DERIVATIONS: Dict[str, Tuple[Module, ...]] = {}
+
+
+def _pack_modules(modules) -> bytes:
+    """Serialize modules: count, symbols, parameter counts, float64 values."""
+    symbols = ''.join(m.symbol for m in modules).encode('ascii')
+    counts = bytes(len(m.params) for m in modules)
+    values = array('d', [x for m in modules for x in m.params])
+    return len(modules).to_bytes(8, 'little') + symbols + counts + values.tobytes()
+
+
+def _unpack_modules(data: bytes) -> Tuple[Module, ...]:
+    """
+    Inverse of _pack_modules.
+    
+    Raises:
+        ValueError: If the data is truncated or malformed
+    """
+    count = int.from_bytes(data[:8], 'little')
+    symbols = data[8:8 + count].decode('ascii')
+    counts = data[8 + count:8 + 2 * count]
+    values = array('d')
+    values.frombytes(data[8 + 2 * count:])
+    if len(symbols) != count or len(counts) != count or len(values) != sum(counts):
+        raise ValueError("Truncated module cache")
+    stream = iter(values.tolist())
+    return tuple(
+        Module(symbol, tuple(islice(stream, n))) if n else Module(symbol)
+        for symbol, n in zip(symbols, counts)
+    )
+
+
+class PresetRecord(NamedTuple):
+    """Immutable, attribute-access view of a preset's commonly used fields."""
+    axiom: str
+    rules: Mapping[str, str]
+    angle: float
+    iterations: int
+    is_3d: bool
+    render_polygons: bool
+    tropism_strength: float
+    tropism_direction: Optional[Tuple[float, float, float]]
+    growth_mode: Optional[str]
+    width_decay: Optional[float]
+    description: str
+    productions: tuple = ()
+
+
+def _build_preset_records() -> Dict[str, PresetRecord]:
+    """Build one PresetRecord per preset name."""
+    records = {}
+    for row, name in enumerate(_PRESET_NAMES):
+        preset = PRESETS_2D.get(name) or PRESETS_3D.get(name) or PARAMETRIC_PRESETS[name]
+        records[name] = PresetRecord(
+            axiom=preset['axiom'],
+            rules=MappingProxyType(preset.get('rules', {})),
+            angle=preset['angle'],
+            iterations=preset['iterations'],
+            is_3d=_PRESET_IS_3D[row],
+            render_polygons=_PRESET_RENDER_POLY[row],
+            tropism_strength=preset.get('tropism_strength', 0.0),
+            tropism_direction=preset.get('tropism_direction'),
+            growth_mode=preset.get('growth_mode'),
+            width_decay=preset.get('width_decay'),
+            description=preset.get('description', ''),
+            productions=tuple(preset.get('productions', ())),
+        )
+    return records
+
+
+def _build_parametric_public() -> Dict[str, Dict[str, Any]]:
+    """Build the caller-facing form of every parametric preset."""
+    return {
+        name: {**body, 'is_parametric': True}
+        for name, body in PARAMETRIC_PRESETS.items()
+    }
+
+
+# Names defined by _load(); module attribute access to them triggers the load
+_LAZY_NAMES = frozenset({
+    'PRESETS', 'PRESETS_3D', 'PARAMETRIC_PRESETS',
+    '_PRESET_INDEX_LOWER_3D', '_PRESET_INDEX_LOWER_PARAM', '_PRESET_NAMES_LOWER',
+    '_ALL_PRESETS_SORTED', '_PARAM_PRESETS_SORTED', '_CATEGORY_INDEX',
+    '_PRESET_NAMES', '_PRESET_AXIOMS', '_PRESET_ITERS', '_PRESET_ANGLES',
+    '_PRESET_IS_3D', '_PRESET_RENDER_POLY', '_PRESET_GROWTH_MODE',
+    '_PRESET_RECORDS', '_PARAMETRIC_PUBLIC',
+})
+
+_LOAD_LOCK = threading.Lock()
+_loaded = False
+
+
+def _load():
+    """
+    Build the 3D and parametric tables and every index spanning all tables.
+    
+    Only PRESETS_2D is built at import; this runs on the first lookup that
+    needs anything else, so startup does not pay for presets never used.
+    """
+    global _loaded
+    global PRESETS, PRESETS_3D, PARAMETRIC_PRESETS
+    global _PRESET_INDEX_LOWER_3D, _PRESET_INDEX_LOWER_PARAM, _PRESET_NAMES_LOWER
+    global _ALL_PRESETS_SORTED, _PARAM_PRESETS_SORTED
+    global _PRESET_NAMES, _PRESET_AXIOMS, _PRESET_ITERS, _PRESET_ANGLES
+    global _PRESET_IS_3D, _PRESET_RENDER_POLY, _PRESET_GROWTH_MODE
+    global _PRESET_RECORDS, _PARAMETRIC_PUBLIC, _PRESET_BY_LOWER
+    if _loaded:
+        return
+    with _LOAD_LOCK:
+        if _loaded:
+            return
+        from lsystem._presets_3d import PRESETS_3D
+        from lsystem._presets_parametric import PARAMETRIC_PRESETS
+        _compile_presets(PRESETS_3D)
+        _compile_presets(PARAMETRIC_PRESETS)
+        
+        _PRESET_INDEX_LOWER_3D = {name.lower(): name for name in PRESETS_3D}
+        _PRESET_INDEX_LOWER_PARAM = {name.lower(): name for name in PARAMETRIC_PRESETS}
+        _PRESET_NAMES_LOWER = frozenset(_PRESET_INDEX_LOWER_2D).union(
+            _PRESET_INDEX_LOWER_3D, _PRESET_INDEX_LOWER_PARAM
+        )
+        _ALL_PRESETS_SORTED = tuple(
+            sorted(chain(PRESETS_2D, PRESETS_3D, PARAMETRIC_PRESETS))
+        )
+        _PARAM_PRESETS_SORTED = tuple(sorted(PARAMETRIC_PRESETS))
+        _rebuild_category_index()
+        
+        (_PRESET_NAMES, _PRESET_AXIOMS, _PRESET_ITERS, _PRESET_ANGLES,
+         _PRESET_IS_3D, _PRESET_RENDER_POLY, _PRESET_GROWTH_MODE) = _build_soa()
+        _PRESET_RECORDS = _build_preset_records()
+        # Parametric presets as returned by get_preset
+        _PARAMETRIC_PUBLIC = _build_parametric_public()
+        # Same precedence as get_preset: 2D, then 3D, then parametric
+        by_lower = {lower: _PARAMETRIC_PUBLIC[key]
+                    for lower, key in _PRESET_INDEX_LOWER_PARAM.items()}
+        by_lower.update((lower, PRESETS_3D[key])
+                        for lower, key in _PRESET_INDEX_LOWER_3D.items())
+        by_lower.update(_PRESET_BY_LOWER)
+        _PRESET_BY_LOWER = by_lower
+        # Same lookup precedence and iteration order as {**PRESETS_2D, **PRESETS_3D}
+        PRESETS = ChainMap(PRESETS_3D, PRESETS_2D)
+        _loaded = True
+
+
+def __getattr__(name: str):
+    """Load the full preset tables on first access to a lazily built name."""
+    if name in _LAZY_NAMES:
+        _load()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def get_preset(name: str, include_3d=True):
-    """Get a preset by name from any category."""
-    name_lower = name.lower()
-    
-    for key in PRESETS_2D:
-        if key.lower() == name_lower:
+@lru_cache(maxsize=256)
+def _norm(name: str) -> str:
+    """Normalize a preset name for lookup (cached for repeated queries)."""
+    return name.lower()
+
+
+def preset_exists(name: str) -> bool:
+    """Check whether a preset name exists in any category (case-insensitive)."""
+    name_lower = _norm(name)
+    if name_lower in _PRESET_INDEX_LOWER_2D:
+        return True
+    _load()
+    return name_lower in _PRESET_NAMES_LOWER
+
+
+def get_preset(name: str, include_3d=True, as_record=False):
+    """
+    Get a preset by name from any category.
+    
+    2D and 3D presets are returned as the table dicts themselves; copy
+    one before modifying it. Parametric presets come back as a fresh
+    dict on every call. With as_record=True a PresetRecord is returned
+    instead of the dict.
+    """
+    preset = _get_preset(name, include_3d, as_record)
+    if preset is not None and not as_record and 'is_parametric' in preset:
+        return dict(preset)
+    return preset
+
+
+@lru_cache(maxsize=256)
+def _get_preset(name: str, include_3d: bool, as_record: bool):
+    """Look up a preset for get_preset (cached per arguments)."""
+    name_lower = _norm(name)
+    
+    key = _PRESET_INDEX_LOWER_2D.get(name_lower)
+    if key is not None:
+        if not as_record:
             return PRESETS_2D[key]
+        _load()
+        return _PRESET_RECORDS[key]
     
     if not include_3d:
         return None
     
-    for key in PRESETS_3D:
-        if key.lower() == name_lower:
-            return PRESETS_3D[key]
+    _load()
+    key = _PRESET_INDEX_LOWER_3D.get(name_lower)
+    if key is not None:
+        return _PRESET_RECORDS[key] if as_record else PRESETS_3D[key]
     
-    for key in PARAMETRIC_PRESETS:
-        if key.lower() == name_lower:
-            preset = PARAMETRIC_PRESETS[key].copy()
-            preset['is_parametric'] = True
-            if 'productions' in preset and 'rules' not in preset:
-                preset['rules'] = {'parametric': str(preset['productions'])}
-            return preset
+    key = _PRESET_INDEX_LOWER_PARAM.get(name_lower)
+    if key is not None:
+        return _PRESET_RECORDS[key] if as_record else _PARAMETRIC_PUBLIC[key]
     
     return None
 
 
+def get_preset_fast(lower_name: str):
+    """
+    Get a preset by its lowercased name in one index probe.
+    
+    For inner loops over known names: the caller lowercases the name, and
+    a missing preset raises KeyError instead of returning None. Returns
+    the same kind of object as get_preset(name).
+    """
+    try:
+        preset = _PRESET_BY_LOWER[lower_name]
+    except KeyError:
+        if _loaded:
+            raise
+        _load()
+        preset = _PRESET_BY_LOWER[lower_name]
+    if 'is_parametric' in preset:
+        return dict(preset)
+    return preset
+
+
 def list_presets(include_3d=True):
     """Return list of preset names."""
-    all_presets = []
-    all_presets.extend(PRESETS_2D.keys())
-    
     if include_3d:
-        all_presets.extend(PRESETS_3D.keys())
-        all_presets.extend(PARAMETRIC_PRESETS.keys())
-    
-    return sorted(all_presets)
+        _load()
+        return list(_ALL_PRESETS_SORTED)
+    return list(_ALL_PRESETS_NO_3D_SORTED)
 
 
 def list_parametric_presets():
     """Return list of parametric preset names."""
-    return sorted(PARAMETRIC_PRESETS.keys())
+    _load()
+    return list(_PARAM_PRESETS_SORTED)
+
+
+def filter_presets(is_3d=None, render_polygons=None):
+    """
+    Return sorted preset names matching the given flags.
+    
+    Args:
+        is_3d: Keep only 3D (True) or 2D (False) presets; None for both
+        render_polygons: Keep only presets with (True) or without (False)
+            polygon rendering; None for both
+    """
+    return list(_filtered_presets(is_3d, render_polygons))
+
+
+@lru_cache(maxsize=None)
+def _filtered_presets(is_3d, render_polygons) -> Tuple[str, ...]:
+    """Matching names for filter_presets; the tables are static, so filter once."""
+    _load()
+    return tuple(
+        name
+        for name, flag_3d, flag_poly in zip(
+            _PRESET_NAMES, _PRESET_IS_3D, _PRESET_RENDER_POLY
+        )
+        if (is_3d is None or flag_3d == is_3d)
+        and (render_polygons is None or flag_poly == render_polygons)
+    )
 
 
 def get_parametric_preset(name: str):
@@ -1385,17 +714,188 @@ def get_parametric_preset(name: str):
     return get_preset(name)
 
 
-def list_presets_by_category():
-    """Return presets organized by category."""
-    categories = {}
-    
-    for name, preset in {**PRESETS_2D, **PRESETS_3D, **PARAMETRIC_PRESETS}.items():
-        category = preset.get('category', 'other')
-        if category not in categories:
-            categories[category] = []
-        categories[category].append(name)
-    
-    return {k: sorted(v) for k, v in sorted(categories.items())}
+def get_compiled_productions(name: str) -> Optional[List[Production]]:
+    """
+    Get the precompiled productions of a parametric preset.
+    
+    Returns:
+        New list of shared Production objects, or None if the preset has
+        no productions
+    """
+    _load()
+    key = _PRESET_INDEX_LOWER_PARAM.get(_norm(name))
+    if key is None or key not in _COMPILED_PRODUCTIONS:
+        return None
+    return list(_COMPILED_PRODUCTIONS[key])
 
 
-PRESETS = {**PRESETS_2D, **PRESETS_3D}
\ No newline at end of file
+def expand_preset(name: str, iterations: Optional[int] = None) -> str:
+    """
+    Expand a 2D/3D preset to its L-system string.
+    
+    Presets with the same axiom, rules and iterations share one cached
+    expansion, so variants that only differ in rendering parameters
+    (tropism, angle) are expanded once.
+    
+    Raises:
+        KeyError: If name is not a 2D/3D preset
+        LSystemError: If the expansion exceeds the engine's length limit
+    """
+    record = get_preset(name, as_record=True)
+    if record is None or record.productions:
+        raise KeyError(f"Unknown preset: {name}")
+    if iterations is None:
+        iterations = record.iterations
+    return _expand(*_expansion_key(record.axiom, record.rules, iterations))
+
+
+def get_expanded(name: str) -> str:
+    """Get a 2D/3D preset's expansion at its default iterations (cached)."""
+    return expand_preset(name)
+
+
+@lru_cache(maxsize=32)
+def get_program(name: str):
+    """
+    Get a 2D/3D preset's expansion as parallel numpy arrays (cached).
+    
+    Animation frames re-read the same expansion, so it is tokenized once.
+    
+    Returns:
+        Read-only (ops, args, depth): uint8 symbol codes, float32 arguments
+        (NaN where a symbol has none) and int32 bracket depth after each
+        symbol. None when numpy is not installed.
+    
+    Raises:
+        KeyError: If name is not a 2D/3D preset
+    """
+    expanded = expand_preset(name)
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    if '(' in expanded:
+        ops, args = _tokenize(name, expanded)
+        ops = np.frombuffer(ops, dtype=np.uint8)
+        args = np.frombuffer(args, dtype=np.float32)
+    else:
+        # No inline arguments: one symbol per character
+        ops = np.frombuffer(expanded.encode('ascii'), dtype=np.uint8)
+        args = np.full(len(ops), np.nan, dtype=np.float32)
+    depth = (np.cumsum(ops == ord('['), dtype=np.int32)
+             - np.cumsum(ops == ord(']'), dtype=np.int32))
+    for column in (ops, args, depth):
+        column.setflags(write=False)
+    return ops, args, depth
+
+
+def derive_preset(
+    name: str,
+    iterations: Optional[int] = None,
+    seed: Optional[int] = None,
+    constants: Optional[Mapping[str, float]] = None,
+) -> Tuple[Module, ...]:
+    """
+    Derive a parametric preset to its final modules.
+    
+    A preset without stochastic productions (probability below 1) draws
+    no random numbers, so its derivation depends only on the preset's
+    content and the iteration count and is cached under a hash of both.
+    Large derivations are also cached on disk next to the expansions.
+    Stochastic derivations run fresh on every call.
+    
+    Args:
+        name: Parametric preset name
+        iterations: Derivation steps (preset default if None)
+        seed: Random seed for stochastic presets, as for ParametricLSystem;
+            deterministic derivations leave the random generator untouched
+        constants: Values overriding the preset's constants
+    
+    Raises:
+        KeyError: If name is not a parametric preset
+        ParametricLSystemError: If the derivation exceeds the module limit
+    """
+    _load()
+    key = _PRESET_INDEX_LOWER_PARAM.get(_norm(name))
+    if key is None or key not in _COMPILED_PRODUCTIONS:
+        raise KeyError(f"Unknown parametric preset: {name}")
+    preset = PARAMETRIC_PRESETS[key]
+    if iterations is None:
+        iterations = preset['iterations']
+    merged = dict(preset.get('constants') or {})
+    merged.update(constants or {})
+    productions = _COMPILED_PRODUCTIONS[key]
+    if any(p.probability < 1.0 for p in productions):
+        lsys = ParametricLSystem(preset['axiom'], list(productions), iterations,
+                                 random_seed=seed, constants=merged)
+        return tuple(lsys.generate())
+    
+    content = repr((preset['axiom'], productions, sorted(merged.items()), iterations))
+    digest = hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+    path = _disk_cache_dir() / f"{digest}.mod"
+    modules = _DERIVATIONS.pop(digest, None)
+    if modules is None:
+        try:
+            modules = _unpack_modules(path.read_bytes())
+        except (OSError, ValueError):
+            pass
+    if modules is None:
+        lsys = ParametricLSystem(preset['axiom'], list(productions), iterations,
+                                 constants=merged)
+        modules = tuple(lsys.generate())
+        if len(modules) >= _DISK_CACHE_MIN_MODULES:
+            _write_disk_cache(path, _pack_modules(modules))
+    
+    _DERIVATIONS[digest] = modules
+    if len(_DERIVATIONS) > _DERIVATION_CACHE_SIZE:
+        del _DERIVATIONS[next(iter(_DERIVATIONS))]
+    return modules
+
+
+def warm_expansion_cache(names=None) -> threading.Thread:
+    """
+    Expand presets in a background thread so later lookups are instant.
+    
+    Args:
+        names: Preset names to expand; defaults to the 2D/3D presets whose
+            description is tagged [BEST]
+    
+    Returns:
+        The started daemon thread
+    
+    Raises:
+        KeyError: If a name is not a 2D/3D preset
+    """
+    _load()
+    if names is None:
+        names = [
+            name for name, preset in chain(PRESETS_2D.items(), PRESETS_3D.items())
+            if '[BEST]' in preset.get('description', '')
+        ]
+    else:
+        known = _PRESET_INDEX_LOWER_2D.keys() | _PRESET_INDEX_LOWER_3D.keys()
+        for name in names:
+            if _norm(name) not in known:
+                raise KeyError(f"Unknown preset: {name}")
+    
+    def warm():
+        for name in names:
+            try:
+                expand_preset(name)
+            except LSystemError:
+                pass
+    
+    thread = threading.Thread(target=warm, name="preset-expansion", daemon=True)
+    thread.start()
+    return thread
+
+
+def list_presets_by_category():
+    """
+    Return presets organized by category.
+    
+    Each call returns a new dict of category -> list of names, built from
+    the precomputed index, so callers may modify it freely.
+    """
+    _load()
+    return {k: list(v) for k, v in _CATEGORY_INDEX.items()}
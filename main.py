@@ -13,6 +13,7 @@ Enhanced with ABOP features:
 
 import argparse
 import os
+import random
 import sys
 import time
 from pathlib import Path
@@ -24,7 +25,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from lsystem.engine import LSystem, parse_rules
 from lsystem.presets import (
     PRESETS, PRESETS_3D, get_preset, list_presets, list_presets_by_category,
-    PARAMETRIC_PRESETS, get_parametric_preset, list_parametric_presets
+    PARAMETRIC_PRESETS, get_parametric_preset, list_parametric_presets,
+    expand_preset, derive_preset
 )
 from turtle.interpreter import TurtleInterpreter
 from povray.generator import POVRayGenerator, ColorMode
@@ -281,6 +283,8 @@ Available parametric presets: """ + ", ".join(list_parametric_presets())
                               help="Gravitropism strength 0-1 (default: 0)")
     three_d_group.add_argument("--tropism-direction", type=str, default="0,1,0",
                               help="Tropism vector X,Y,Z (default: 0,1,0)")
+    three_d_group.add_argument("--min-pixel-size", type=float, default=0.0,
+                              help="Leave out geometry smaller than this many pixels (default: 0, keep all)")
     
     # === Output parameters ===
     out_group = parser.add_argument_group('Output Parameters')
@@ -532,40 +536,50 @@ Available parametric presets: """ + ", ".join(list_parametric_presets())
         # Use parametric L-system engine
         from lsystem.parametric import ParametricLSystem, parse_production_string, Production
         
-        # Parse productions - handle both string and dict formats
-        productions = []
-        for prod_item in productions_list:
-            if isinstance(prod_item, str):
-                # Plain string format: "A(l,w) : l < 5 -> ..."
-                productions.append(parse_production_string(prod_item))
-            elif isinstance(prod_item, dict):
-                # Dict format: {"rule": "...", "probability": 0.33}
-                prod = parse_production_string(prod_item['rule'])
-                if 'probability' in prod_item:
-                    prod = Production(
-                        predecessor=prod.predecessor,
-                        formal_params=prod.formal_params,
-                        condition=prod.condition,
-                        successor=prod.successor,
-                        probability=prod_item['probability'],
-                        left_context=prod.left_context,
-                        right_context=prod.right_context
-                    )
-                productions.append(prod)
-            else:
-                raise ValueError(f"Unknown production format: {type(prod_item)}")
-        
-        parametric_lsystem = ParametricLSystem(
-            axiom=axiom,
-            productions=productions,
-            iterations=iterations,
-            random_seed=args.seed,
-            constants=constants
-        )
+        # --seed also fixes the turtle's angle jitter, so seed here rather
+        # than rely on the derivation: cached derivations draw nothing
+        if args.seed is not None:
+            random.seed(args.seed)
         
         try:
-            modules = parametric_lsystem.generate()
-            lsystem_string = parametric_lsystem.to_string(modules)
+            if args.preset:
+                # Preset productions are compiled at load; derivations
+                # without random draws are cached, also on disk
+                modules = derive_preset(args.preset, iterations,
+                                        seed=args.seed, constants=constants)
+            else:
+                # Parse productions - handle both string and dict formats
+                productions = []
+                for prod_item in productions_list:
+                    if isinstance(prod_item, str):
+                        # Plain string format: "A(l,w) : l < 5 -> ..."
+                        productions.append(parse_production_string(prod_item))
+                    elif isinstance(prod_item, dict):
+                        # Dict format: {"rule": "...", "probability": 0.33}
+                        prod = parse_production_string(prod_item['rule'])
+                        if 'probability' in prod_item:
+                            prod = Production(
+                                predecessor=prod.predecessor,
+                                formal_params=prod.formal_params,
+                                condition=prod.condition,
+                                successor=prod.successor,
+                                probability=prod_item['probability'],
+                                left_context=prod.left_context,
+                                right_context=prod.right_context
+                            )
+                        productions.append(prod)
+                    else:
+                        raise ValueError(f"Unknown production format: {type(prod_item)}")
+                
+                parametric_lsystem = ParametricLSystem(
+                    axiom=axiom,
+                    productions=productions,
+                    iterations=iterations,
+                    random_seed=args.seed,
+                    constants=constants
+                )
+                modules = parametric_lsystem.generate()
+            lsystem_string = ''.join(m.symbol for m in modules)
         except Exception as e:
             print(f"Error: {e}")
             sys.exit(1)
@@ -573,11 +587,13 @@ Available parametric presets: """ + ", ".join(list_parametric_presets())
         print(f"  Modules generated: {len(modules):,}")
         print(f"  String length: {len(lsystem_string):,} characters")
     else:
-        # Use standard L-system engine
-        lsystem = LSystem(axiom, rules, iterations)
-        
+        # Use standard L-system engine; preset expansions are shared
+        # between presets with identical axiom, rules and iterations
         try:
-            lsystem_string = lsystem.generate()
+            if args.preset:
+                lsystem_string = expand_preset(args.preset, iterations)
+            else:
+                lsystem_string = LSystem(axiom, rules, iterations).generate()
         except Exception as e:
             print(f"Error: {e}")
             sys.exit(1)
@@ -667,7 +683,8 @@ Available parametric presets: """ + ", ".join(list_parametric_presets())
             camera_height=args.camera_height,
             show_leaves=args.show_leaves,
             animate_camera=args.animate_camera,
-            camera_rotation=args.camera_rotation
+            camera_rotation=args.camera_rotation,
+            min_pixel_size=args.min_pixel_size
         )
     else:
         generator = POVRayGenerator(
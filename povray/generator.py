@@ -7,6 +7,7 @@ Supports gradient coloring, leaf tips, and improved lighting.
 
 import os
 from enum import Enum
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from turtle.interpreter import Segment, BoundingBox
 
@@ -70,6 +71,14 @@ def depth_to_color(depth: int, max_depth: int, color_mode: ColorMode = ColorMode
     return (min(1.0, r), min(1.0, g), min(1.0, b))
 
 
+@lru_cache(maxsize=256)
+def _segment_material(depth: int, max_depth: int, color_mode: ColorMode) -> str:
+    """Pigment and finish of a branch segment; shared by all segments at a depth."""
+    r, g, b = depth_to_color(depth, max_depth, color_mode)
+    return (f"pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }} "
+            f"finish {{ ambient 0.3 diffuse 0.7 }} }}")
+
+
 def leaf_color(base_color: Tuple[float, float, float], variation: float = 0.1) -> Tuple[float, float, float]:
     """
     Generate a slightly varied leaf color from base branch color.
@@ -209,27 +218,19 @@ union {{
         if length < 0.001:
             return ""
         
-        r, g, b = depth_to_color(segment.depth, max_depth, self.color_mode)
-        
         # Calculate radius (decreases with depth)
         radius = base_radius * segment.width
         if radius < 0.05:
             radius = 0.05
         
-        lines = []
+        # The cylinder and its joint sphere share the end point, radius and
+        # material, so each is formatted once and the record built in one go
+        end = f"<{segment.x2:.6f}, {segment.y2:.6f}, 0>, {radius:.4f} "
+        material = _segment_material(segment.depth, max_depth, self.color_mode)
         
-        # Add cylinder for the segment
-        lines.append(f"    cylinder {{ <{segment.x1:.6f}, {segment.y1:.6f}, 0>, "
-                    f"<{segment.x2:.6f}, {segment.y2:.6f}, 0>, {radius:.4f} "
-                    f"pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }} "
-                    f"finish {{ ambient 0.3 diffuse 0.7 }} }}")
-        
-        # Add sphere at end point for smooth joints
-        lines.append(f"    sphere {{ <{segment.x2:.6f}, {segment.y2:.6f}, 0>, {radius:.4f} "
-                    f"pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }} "
-                    f"finish {{ ambient 0.3 diffuse 0.7 }} }}")
-        
-        return '\n'.join(lines)
+        # Cylinder for the segment, then a sphere at the end point for smooth joints
+        return (f"    cylinder {{ <{segment.x1:.6f}, {segment.y1:.6f}, 0>, {end}{material}\n"
+                f"    sphere {{ {end}{material}")
     
     def _leaf_to_povray(
         self,
@@ -391,16 +392,17 @@ union {{
         r, g, b = color
         z_offset = depth * 0.001  # Small offset based on depth
         
-        lines = [f"    polygon {{ {len(vertices) + 1},"]
-        for x, y in vertices:
-            lines.append(f"        <{x:.4f}, {y:.4f}, {z_offset:.4f}>,")
-        # Close polygon
-        lines.append(f"        <{vertices[0][0]:.4f}, {vertices[0][1]:.4f}, {z_offset:.4f}>")
-        lines.append(f"        pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }}")
-        lines.append(f"        finish {{ ambient 0.4 diffuse 0.6 }}")
-        lines.append("    }")
-        
-        return '\n'.join(lines)
+        # One record per polygon; the closing vertex repeats the first
+        z = f"{z_offset:.4f}>"
+        corners = [f"        <{x:.4f}, {y:.4f}, {z}" for x, y in vertices]
+        return (
+            f"    polygon {{ {len(vertices) + 1},\n"
+            + ",\n".join(corners) + ",\n"
+            + corners[0] + "\n"
+            f"        pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }}\n"
+            f"        finish {{ ambient 0.4 diffuse 0.6 }}\n"
+            "    }"
+        )
     
     def _render_polygons_list(
         self,
@@ -180,7 +180,8 @@ union {{
         camera_rotation: float = 360.0,
         top_down_view: bool = False,  # NEW: for phyllotaxis
         camera_tilt: float = 0.0,     # NEW: angle from horizontal (90 = top-down)
-        use_eased_camera: bool = True  # NEW: smooth camera movement
+        use_eased_camera: bool = True,  # NEW: smooth camera movement
+        min_pixel_size: float = 0.0   # NEW: cull geometry smaller on screen
     ):
         """
         Initialize enhanced 3D POV-Ray generator.
@@ -189,6 +190,8 @@ union {{
             top_down_view: Use top-down camera for spiral patterns
             camera_tilt: Camera tilt angle (0=side, 90=top-down)
             use_eased_camera: Apply easing to camera rotation
+            min_pixel_size: Leave out segments and polygons that would cover
+                fewer pixels than this on screen (0 = keep everything)
         """
         self.output_dir = os.path.abspath(output_dir)
         self.width = width
@@ -206,6 +209,7 @@ union {{
         self.top_down_view = top_down_view
         self.camera_tilt = camera_tilt
         self.use_eased_camera = use_eased_camera
+        self.min_pixel_size = min_pixel_size
         
         os.makedirs(self.output_dir, exist_ok=True)
     
@@ -260,6 +264,39 @@ union {{
         
         return (cam_x, cam_y, cam_z, look_x, look_y, look_z)
     
+    def _subpixel_test(
+        self,
+        cam_pos: Tuple[float, float, float, float, float, float],
+        scene_scale: float
+    ):
+        """
+        Build a test for geometry too small to see from the camera.
+        
+        A feature is culled when its extent covers fewer than min_pixel_size
+        pixels: for a perspective camera the pixel size grows with distance
+        from the camera, for the orthographic camera it is fixed.
+        
+        Returns:
+            Function (point, extent) -> True if the feature is too small
+        """
+        if self.use_perspective or self.top_down_view or self.camera_tilt >= 80:
+            cam_x, cam_y, cam_z = cam_pos[:3]
+            # Angle spanned by min_pixel_size pixels across the horizontal fov
+            angle = math.radians(self.fov) / self.width * self.min_pixel_size
+            
+            def too_small(point, extent):
+                dx = point[0] - cam_x
+                dy = point[1] - cam_y
+                dz = point[2] - cam_z
+                return extent * extent < angle * angle * (dx*dx + dy*dy + dz*dz)
+        else:
+            # Orthographic view height is scene_scale * 1.2 over the image height
+            size = scene_scale * 1.2 / self.height * self.min_pixel_size
+            
+            def too_small(point, extent):
+                return extent < size
+        return too_small
+    
     def _segment_to_povray(
         self,
         segment: Segment3D,
@@ -283,26 +320,21 @@ union {{
         if radius < 0.02:
             radius = 0.02
         
-        lines = []
-        
+        # The cylinder and its joint sphere share the end point, radius and
+        # material, so each is formatted once and the record built in one go
+        end = f"<{segment.x2:.6f}, {segment.y2:.6f}, {segment.z2:.6f}>, {radius:.4f} "
         # Enhanced material with subtle specular
-        lines.append(
-            f"    cylinder {{ "
-            f"<{segment.x1:.6f}, {segment.y1:.6f}, {segment.z1:.6f}>, "
-            f"<{segment.x2:.6f}, {segment.y2:.6f}, {segment.z2:.6f}>, {radius:.4f} "
+        material = (
             f"pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }} "
             f"finish {{ ambient 0.25 diffuse 0.70 specular 0.08 roughness 0.05 }} }}"
         )
         
         # Sphere at endpoints for smooth joints
-        lines.append(
-            f"    sphere {{ "
-            f"<{segment.x2:.6f}, {segment.y2:.6f}, {segment.z2:.6f}>, {radius:.4f} "
-            f"pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }} "
-            f"finish {{ ambient 0.25 diffuse 0.70 specular 0.08 roughness 0.05 }} }}"
+        return (
+            f"    cylinder {{ <{segment.x1:.6f}, {segment.y1:.6f}, {segment.z1:.6f}>, "
+            f"{end}{material}\n"
+            f"    sphere {{ {end}{material}"
         )
-        
-        return '\n'.join(lines)
     
     def _leaf_to_povray(
         self,
@@ -382,43 +414,61 @@ union {{
         cy = sum(v[1] for v in vertices) / len(vertices)
         cz = sum(v[2] for v in vertices) / len(vertices)
         
-        lines = []
+        def dist_sq(a, b):
+            return (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
+        
+        min_dist = 0.0001  # Minimum distance squared
+        centroid = (cx, cy, cz)
+        # Every vertex is shared by two triangles: format it and test its
+        # distance to the centroid once, then write each triangle as one string
+        corners = [f"        <{v[0]:.4f}, {v[1]:.4f}, {v[2]:.4f}>,\n" for v in vertices]
+        near_centroid = [dist_sq(v, centroid) < min_dist for v in vertices]
+        tail = (
+            f"        <{cx:.4f}, {cy:.4f}, {cz:.4f}>\n"
+            f"        pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }}\n"
+            f"        finish {{ ambient 0.35 diffuse 0.60 specular 0.12 roughness 0.02 }}\n"
+            f"        double_illuminate\n"  # KEY: visible from both sides!
+            f"    }}"
+        )
+        
+        triangles = []
         
         # Create triangles fanning from centroid, skip degenerate ones
         for i in range(len(vertices)):
-            v1 = vertices[i]
-            v2 = vertices[(i + 1) % len(vertices)]
+            j = (i + 1) % len(vertices)
             
             # Check for degenerate triangle (vertices too close)
-            def dist_sq(a, b):
-                return (a[0]-b[0])**2 + (a[1]-b[1])**2 + (a[2]-b[2])**2
-            
-            min_dist = 0.0001  # Minimum distance squared
-            if dist_sq(v1, v2) < min_dist or dist_sq(v1, (cx,cy,cz)) < min_dist or dist_sq(v2, (cx,cy,cz)) < min_dist:
+            if dist_sq(vertices[i], vertices[j]) < min_dist or near_centroid[i] or near_centroid[j]:
                 continue  # Skip degenerate triangle
             
-            lines.append(f"    triangle {{")
-            lines.append(f"        <{v1[0]:.4f}, {v1[1]:.4f}, {v1[2]:.4f}>,")
-            lines.append(f"        <{v2[0]:.4f}, {v2[1]:.4f}, {v2[2]:.4f}>,")
-            lines.append(f"        <{cx:.4f}, {cy:.4f}, {cz:.4f}>")
-            lines.append(f"        pigment {{ rgb <{r:.4f}, {g:.4f}, {b:.4f}> }}")
-            lines.append(f"        finish {{ ambient 0.35 diffuse 0.60 specular 0.12 roughness 0.02 }}")
-            lines.append(f"        double_illuminate")  # KEY: visible from both sides!
-            lines.append(f"    }}")
-        
-        return '\n'.join(lines)
+            triangles.append("    triangle {\n" + corners[i] + corners[j] + tail)
+        
+        return '\n'.join(triangles)
     
     def _render_polygons_list_3d(
         self,
         polygons: List,
-        max_depth: int
+        max_depth: int,
+        too_small=None
     ) -> List[str]:
-        """Render 3D polygons with enhanced color palette and double_illuminate."""
+        """
+        Render 3D polygons with enhanced color palette and double_illuminate.
+        
+        Polygons for which too_small(first_vertex, extent) is true are skipped.
+        """
         geometry_lines = []
         
         for poly in polygons:
             if not hasattr(poly, 'vertices') or len(poly.vertices) < 3:
                 continue
+            if too_small is not None:
+                # Largest side of the polygon's bounding box
+                extent = max(
+                    max(v[axis] for v in poly.vertices) - min(v[axis] for v in poly.vertices)
+                    for axis in range(3)
+                )
+                if too_small(poly.vertices[0], extent):
+                    continue
             
             depth = getattr(poly, 'depth', 0)
             color_index = getattr(poly, 'color_index', 0)
@@ -489,9 +539,18 @@ union {{
         # Calculate base radius
         base_radius = scene_scale * 0.012
         
+        too_small = None
+        if self.min_pixel_size > 0:
+            too_small = self._subpixel_test(cam_pos, scene_scale)
+        
         # Generate geometry
         geometry_lines = []
         for segment in segments:
+            if too_small is not None:
+                # A segment is drawn at least as wide as its cylinder
+                extent = max(segment.length(), 2 * max(base_radius * segment.width, 0.02))
+                if too_small((segment.x2, segment.y2, segment.z2), extent):
+                    continue
             pov_geom = self._segment_to_povray(segment, max_depth, base_radius)
             if pov_geom:
                 geometry_lines.append(pov_geom)
@@ -507,7 +566,7 @@ union {{
         
         # Add polygons (with double_illuminate)
         if polygons:
-            polygon_geom = self._render_polygons_list_3d(polygons, max_depth)
+            polygon_geom = self._render_polygons_list_3d(polygons, max_depth, too_small)
             geometry_lines.extend(polygon_geom)
         
         geometry = '\n'.join(geometry_lines)
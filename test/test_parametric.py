@@ -22,7 +22,11 @@ from lsystem.parametric import (
     parse_parametric_word, 
     parse_production_string,
     parse_stochastic_production,
-    _eval_expr
+    _eval_expr,
+    _compile_arg,
+    _eval_arg,
+    _evaluate_word,
+    compile_successor
 )
 
 
@@ -150,6 +154,30 @@ class TestProduction:
         assert result[0].symbol == "B"
         assert abs(result[0].params[0] - 6.0) < 0.01
     
+    def test_generated_successor(self):
+        """Test the generated successor function matches the token loop."""
+        prod = Production("A", ("l", "w"), None, "!(w)F(l*0.9)[&(-30)A(l,w*0.7)]X")
+        assert prod._successor_fn is not None
+        params = {"l": 2.0, "w": 0.5}
+        expected = _evaluate_word(compile_successor(prod.successor), params)
+        assert prod.apply(params) == expected
+        # Missing parameters fall back to the token loop
+        assert prod.apply({"l": 2.0}) == _evaluate_word(
+            compile_successor(prod.successor), {"l": 2.0})
+        assert Production("A", ("l",), None, "F(sqrt(l))")._successor_fn is None
+    
+    def test_generated_arithmetic(self):
+        """Test inlined arithmetic and conditions agree with eval()."""
+        prod = Production("A", ("x", "y"), "x > y and not x == 4", "B(x+1,-x/y,x*y-0.5)")
+        assert prod._successor_fn is not None
+        assert prod._condition_fn is not None
+        for x, y in ((5.0, 3.0), (4.0, 3.0), (1.0, 3.0), (2.0, 0.0)):
+            params = {"x": x, "y": y}
+            assert prod.matches(Module("A", (x, y)), params) == bool(x > y and not x == 4)
+            assert prod.apply(params) == _evaluate_word(compile_successor(prod.successor), params)
+        # Names missing from the parameters still resolve to the math helpers
+        assert Production("A", ("x",), "x < pi", "B").matches(Module("A", (3.0,)), {"x": 3.0})
+    
     def test_complex_condition(self):
         """Test complex condition with math functions."""
         prod = Production("A", ("x", "y"), "x > y and x < 10", "B")
@@ -286,6 +314,28 @@ class TestParametricLSystem:
         # X should persist since no production matches
         assert any(m.symbol == "X" for m in result)
 
+    def test_tail_recursion_keeps_settled_prefix(self):
+        """Test that a tail-recursive rule derives every step and then stops."""
+        prods = [
+            Production("A", ("l",), "l < 4", "F(l)A(l+1)"),
+        ]
+        lsys = ParametricLSystem("A(1)", prods, iterations=10)
+
+        assert lsys.to_string() == "FFFA"
+        assert [m.params for m in lsys.generate()] == [(1,), (2,), (3,), (4,)]
+    
+    def test_left_context_signal(self):
+        """Test a context-sensitive rule next to symbols that have no rules."""
+        prods = [
+            Production("A", (), None, "B", left_context="B"),
+            Production("F", (), None, "FF"),
+        ]
+        
+        # The signal moves one A per step, skipping ignored symbols
+        assert ParametricLSystem("BF+AA", prods, 1, ignore_symbols="+F").to_string() == "BFF+BA"
+        assert ParametricLSystem("BF+AA", prods, 2, ignore_symbols="+F").to_string() == "BFFFF+BB"
+        assert ParametricLSystem("BF+AA", prods, 1).to_string() == "BFF+AA"
+
 
 class TestExpressionEvaluation:
     """Tests for expression evaluation."""
@@ -307,6 +357,13 @@ class TestExpressionEvaluation:
         assert abs(_eval_expr("sqrt(16)", {}) - 4) < 0.01
         assert abs(_eval_expr("sin(0)", {}) - 0) < 0.01
         assert abs(_eval_expr("pi", {}) - math.pi) < 0.01
+    
+    def test_compiled_argument_shapes(self):
+        """Test that simple arguments skip eval() and match it exactly."""
+        params = {"l": 0.7, "w": 3}
+        for expr in ("-60", "45", "w", "l*0.9", "l*w+1", "pi", "q*2", "l*"):
+            assert _eval_arg(_compile_arg(expr), params) == _eval_expr(expr, params)
+        assert _compile_arg("-60")[0] != _compile_arg("l*0.9")[0] != _compile_arg("l*w+1")[0]
 
 
 class TestStochasticProductions:
@@ -335,6 +392,16 @@ class TestStochasticProductions:
         # Should roughly follow 70/30 distribution
         # Allow some variance since it's random
         assert a_count > b_count  # A should be more common
+    
+    def test_partial_match_selection(self):
+        """Test selection only among productions whose condition holds."""
+        prods = [
+            Production("F", ("x",), "x > 5", "A", probability=0.9),
+            Production("F", ("x",), None, "B", probability=0.1),
+        ]
+        for i in range(10):
+            lsys = ParametricLSystem("F(1)", prods, iterations=1, random_seed=i)
+            assert lsys.to_string() == "B"
 
 
 if __name__ == "__main__":
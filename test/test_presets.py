@@ -0,0 +1,365 @@
+"""
+Tests for L-System Presets
+
+Tests the preset tables and lookup helpers:
+- Import-time normalization
+- Lookup and listing helpers
+"""
+
+import json
+import pytest
+import subprocess
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lsystem import presets
+from lsystem.engine import LSystem, LSystemError, make_rewriter
+from lsystem.presets import (
+    PRESETS,
+    PRESETS_2D,
+    PRESETS_3D,
+    PARAMETRIC_PRESETS,
+    get_preset,
+    get_preset_fast,
+    list_presets,
+    list_presets_by_category,
+    preset_exists,
+    filter_presets,
+    get_compiled_productions,
+    expand_preset,
+    derive_preset,
+    get_expanded,
+    get_program,
+    warm_expansion_cache,
+    _compile_productions,
+    _intern_preset,
+    _tokenize,
+    _disk_cache_path,
+    _expand,
+    _expansion_key,
+)
+
+
+ALL_TABLES = (PRESETS_2D, PRESETS_3D, PARAMETRIC_PRESETS)
+
+
+class TestNormalization:
+    """Tests for import-time preset normalization."""
+
+    def test_category_defaulted(self):
+        """Test every preset has a category after import."""
+        for table in ALL_TABLES:
+            for preset in table.values():
+                assert preset['category'] == preset.get('category', 'other')
+                assert preset['category']
+
+    def test_missing_rules_filled(self):
+        """Test parametric entries without rules get a text stand-in."""
+        from lsystem.presets import _compile_presets, _COMPILED_PRODUCTIONS
+        entry = {'axiom': 'A', 'productions': ['A -> AB']}
+        _compile_presets({'custom': entry})
+        _COMPILED_PRODUCTIONS.pop('custom')
+        assert entry['rules'] == {'parametric': "['A -> AB']"}
+
+    def test_tropism_vectors_shared(self):
+        """Test equal tropism directions share one immutable tuple."""
+        a = PRESETS_3D['tree_gravity_0_none']['tropism_direction']
+        b = PARAMETRIC_PRESETS['oak_param']['tropism_direction']
+        assert a == (0.0, -1.0, 0.0)
+        assert a is b
+
+    def test_rule_strings_interned(self):
+        """Test interning maps runtime-built rule text onto preset strings."""
+        successor = PRESETS_3D['tree_gravity_0_none']['rules']['A']
+        entry = {'axiom': 'A', 'rules': {'A': ''.join(list(successor))}}
+        _intern_preset(entry)
+        assert entry['rules']['A'] is successor
+
+    def test_translate_with_inline_arguments(self):
+        """Test translate rewriting leaves inline arguments like F(200) intact."""
+        preset = PRESETS_3D['ternary_2_8a']
+        lsystem = LSystem(preset['axiom'], preset['rules'], 3)
+        assert all(isinstance(key, int) for key in lsystem._translate_table)
+        expected = preset['axiom']
+        for _ in range(3):
+            expected = ''.join(preset['rules'].get(c, c) for c in expected)
+        assert lsystem.generate() == expected
+
+    def test_compiled_productions(self):
+        """Test preset productions are compiled once with their probabilities."""
+        productions = get_compiled_productions("Stochastic_Plant")
+        assert [p.probability for p in productions] == [0.33, 0.33, 0.34]
+        assert productions[0] is get_compiled_productions("stochastic_plant")[0]
+        assert get_compiled_productions("dragon_curve") is None
+
+    def test_compiled_productions_shared(self):
+        """Test presets repeating a rule share one compiled Production."""
+        shared = set(map(id, get_compiled_productions("monopodial_tree")))
+        shared &= set(map(id, get_compiled_productions("honda_2_6a")))
+        assert shared
+
+    def test_tokenize(self):
+        """Test words are split into symbol and argument arrays."""
+        ops, args = _tokenize('sympodial_2_7a', PRESETS_3D['sympodial_2_7a']['rules']['A'])
+        assert ''.join(map(chr, ops)) == "!F[&$B][/&$B]"
+        assert args[:2].tolist() == pytest.approx([0.707, 50.0])
+        assert args[2] != args[2]  # NaN: '[' takes no argument
+        with pytest.raises(ValueError, match="broken"):
+            _tokenize("broken", "F(l*2)")
+        with pytest.raises(ValueError, match=r"'\(l\)'"):
+            _tokenize("broken", "F(1)[+F]X(l)")
+
+    def test_variant_rules_shared(self):
+        """Test presets merged from one base keep sharing its rules dict."""
+        rules = PRESETS_3D['tree_gravity_0_none']['rules']
+        assert PRESETS_3D['tree_gravity_2_strong']['rules'] is rules
+
+    def test_invalid_production(self):
+        """Test malformed productions are reported with the preset name."""
+        with pytest.raises(ValueError, match="broken"):
+            _compile_productions("broken", ["A(l) F(l)"])
+
+
+class TestListing:
+    """Tests for preset listing helpers."""
+
+    def test_categories_cover_all_presets(self):
+        """Test category listing contains every preset exactly once."""
+        categories = list_presets_by_category()
+        names = [name for names in categories.values() for name in names]
+        assert sorted(names) == list_presets(include_3d=True)
+        assert len(names) == len(set(names))
+        # Each call returns its own lists
+        next(iter(categories.values())).clear()
+        assert list_presets_by_category() == {
+            k: list(v) for k, v in presets._CATEGORY_INDEX.items()
+        }
+
+    def test_combined_view(self):
+        """Test PRESETS matches the merged 2D and 3D tables without copying."""
+        assert list(PRESETS.items()) == list({**PRESETS_2D, **PRESETS_3D}.items())
+        assert PRESETS['abop_1_25'] is PRESETS_3D['abop_1_25']
+
+    def test_list_presets_2d_only(self):
+        """Test include_3d=False restricts listing to 2D presets."""
+        assert list_presets(include_3d=False) == sorted(PRESETS_2D)
+
+    def test_filter_presets(self):
+        """Test flag filters partition the preset listing."""
+        assert filter_presets() == list_presets()
+        flat = filter_presets(is_3d=False)
+        assert set(PRESETS_2D) <= set(flat)
+        assert 'stochastic_plant' in flat
+        leafy = filter_presets(is_3d=True, render_polygons=True)
+        assert 'abop_1_25' in leafy
+        assert 'oak_simple' not in leafy
+        assert sorted(flat + filter_presets(is_3d=True)) == list_presets()
+        # Results are cached, but each call returns its own list
+        flat.append('not_a_preset')
+        assert 'not_a_preset' not in filter_presets(is_3d=False)
+
+
+class TestExpansion:
+    """Tests for shared preset expansion."""
+
+    def test_expansion_shared(self):
+        """Test grouped presets return the same cached expansion."""
+        a = expand_preset('tree_gravity_0_none', 3)
+        assert expand_preset('tree_gravity_2_strong', 3) is a
+        preset = PRESETS_3D['tree_gravity_0_none']
+        assert a == LSystem(preset['axiom'], preset['rules'], 3).generate()
+
+    def test_get_expanded(self):
+        """Test the default-depth accessor shares the cached expansion."""
+        preset = PRESETS_2D['dragon_curve']
+        assert get_expanded('Dragon_Curve') is expand_preset('dragon_curve', preset['iterations'])
+
+    def test_warm_cache(self):
+        """Test warming expands the requested presets in the background."""
+        warm_expansion_cache(['koch_snowflake']).join()
+        assert get_expanded('koch_snowflake')
+        with pytest.raises(KeyError):
+            warm_expansion_cache(['oak_param'])
+
+    def test_rewriter_matches_engine(self):
+        """Test rule-specialized rewriters agree with the string engine."""
+        for table in (PRESETS_2D, PRESETS_3D):
+            for preset in table.values():
+                rewrite = make_rewriter(dict(preset['rules']))
+                for iterations in range(min(preset['iterations'], 4) + 1):
+                    expected = LSystem(preset['axiom'], dict(preset['rules']), iterations).generate()
+                    assert rewrite(preset['axiom'], iterations) == expected
+                    assert rewrite.length(preset['axiom'], iterations) == len(expected)
+        # Symbols without a rule, deleted symbols and ones that appear late
+        rules = {'A': 'AB', 'B': 'A[C]', 'C': 'D', 'D': ''}
+        rewrite = make_rewriter(rules)
+        for iterations in range(12):
+            assert rewrite('xAB', iterations) == LSystem('xAB', rules, iterations).generate()
+
+    def test_rewriter_plain_strings(self):
+        """Test rewriting is not limited to ASCII symbols."""
+        assert make_rewriter({'F': 'F→F'})('F', 2) == 'F→F→F→F'
+
+    def test_rewriter_length_limit(self):
+        """Test the rewriter enforces the engine's length limit."""
+        with pytest.raises(LSystemError):
+            make_rewriter({'F': 'FF'})('F', 30)
+        # The limit holds for every iteration, not just the final word
+        shrinking = make_rewriter({'A': 'B' * 4000, 'B': 'C' * 4000, 'C': ''})
+        assert shrinking('A', 1) == 'B' * 4000
+        with pytest.raises(LSystemError):
+            shrinking('A', 3)
+        assert make_rewriter({'AB': 'A'}) is None
+
+    def test_program_arrays(self):
+        """Test program columns agree with the tokenized expansion."""
+        np = pytest.importorskip('numpy')
+        for name in ('dragon_curve', 'tree_gravity_1_moderate'):
+            ops, args, depth = get_program(name)
+            expected_ops, expected_args = _tokenize(name, expand_preset(name))
+            assert ops.tolist() == list(expected_ops)
+            assert np.array_equal(args, np.array(expected_args, dtype=np.float32), equal_nan=True)
+            assert depth[-1] == 0
+            assert depth.min() >= 0
+            assert not ops.flags.writeable
+
+    def test_disk_cache(self, tmp_path, monkeypatch):
+        """Test long expansions are written to and read back from disk."""
+        monkeypatch.setenv('LSYSTEM_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(presets, '_DISK_CACHE_MIN_LENGTH', 0)
+        key = _expansion_key('F', {'F': 'F+F'}, 3)
+        expanded = _expand.__wrapped__(*key)
+        path = _disk_cache_path(*key)
+        assert path.parent == tmp_path
+        assert path.read_text() == expanded
+        # A cache file of the wrong length is ignored and rewritten
+        path.write_text('cached')
+        assert _expand.__wrapped__(*key) == expanded
+        assert path.read_text() == expanded
+        # Expansions predicted to be short never touch the disk
+        monkeypatch.setattr(presets, '_DISK_CACHE_MIN_LENGTH', len(expanded) + 1)
+        assert _expand.__wrapped__(*key) == expanded
+
+    def test_expand_unknown(self):
+        """Test parametric or unknown names are rejected."""
+        with pytest.raises(KeyError):
+            expand_preset('oak_param')
+
+    def test_derive_preset_cache(self, tmp_path, monkeypatch):
+        """Test deterministic derivations are cached in memory and on disk."""
+        from lsystem.parametric import create_parametric_lsystem_from_preset
+        monkeypatch.setenv('LSYSTEM_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(presets, '_DISK_CACHE_MIN_MODULES', 0)
+        monkeypatch.setattr(presets, '_DERIVATIONS', {})
+        expected = create_parametric_lsystem_from_preset(PARAMETRIC_PRESETS['oak_param']).generate()
+        modules = derive_preset('oak_param')
+        assert list(modules) == expected
+        assert derive_preset('OAK_PARAM') is modules
+        presets._DERIVATIONS.clear()
+        assert derive_preset('oak_param') == modules
+        assert len(list(tmp_path.glob('*.mod'))) == 1
+
+    def test_derive_preset_stochastic(self, tmp_path, monkeypatch):
+        """Test stochastic derivations follow the seed and are not cached."""
+        monkeypatch.setenv('LSYSTEM_CACHE_DIR', str(tmp_path))
+        monkeypatch.setattr(presets, '_DISK_CACHE_MIN_MODULES', 0)
+        first = derive_preset('stochastic_plant', seed=1)
+        assert derive_preset('stochastic_plant', seed=1) == first
+        assert derive_preset('stochastic_plant', seed=1) is not first
+        assert not list(tmp_path.glob('*.mod'))
+        with pytest.raises(KeyError):
+            derive_preset('dragon_curve')
+
+
+class TestLookup:
+    """Tests for get_preset."""
+
+    def test_case_insensitive(self):
+        """Test lookups ignore case."""
+        assert get_preset("ABOP_1_24A") is PRESETS_2D["abop_1_24a"]
+
+    def test_unknown(self):
+        """Test unknown preset returns None."""
+        assert get_preset("no_such_preset") is None
+
+    def test_entries_plain(self):
+        """Test 2D/3D entries are plain dicts with only public fields."""
+        for name in ("abop_1_24a", "abop_1_25"):
+            preset = get_preset(name)
+            assert type(preset) is dict
+            assert not [key for key in preset if key.startswith('_')]
+            assert json.loads(json.dumps(preset))['axiom'] == preset['axiom']
+
+    def test_parametric_flagged(self):
+        """Test parametric lookups are flagged without touching the table."""
+        preset = get_preset("Monopodial_Tree")
+        assert preset['is_parametric'] is True
+        assert 'is_parametric' not in PARAMETRIC_PRESETS['monopodial_tree']
+        assert json.loads(json.dumps(preset))['constants'] == preset['constants']
+        # Each call returns its own dict, so edits do not leak
+        assert get_preset("monopodial_tree") is not preset
+        assert get_preset_fast("monopodial_tree") is not preset
+        preset['iterations'] = -1
+        assert get_preset("monopodial_tree")['iterations'] != -1
+        assert get_preset_fast("monopodial_tree")['iterations'] != -1
+
+    def test_preset_exists(self):
+        """Test existence check across all categories."""
+        assert preset_exists("Dragon_Curve")
+        assert preset_exists("abop_1_25")
+        assert preset_exists("oak_param")
+        assert not preset_exists("no_such_preset")
+
+    def test_as_record(self):
+        """Test record lookups mirror the preset mapping."""
+        record = get_preset("Tree_Gravity_2_Strong", as_record=True)
+        preset = PRESETS_3D['tree_gravity_2_strong']
+        assert record.axiom == preset['axiom']
+        assert record.tropism_strength == preset['tropism_strength']
+        assert record.is_3d and record.productions == ()
+        assert get_preset("oak_param", as_record=True).productions
+        assert get_preset("no_such_preset", as_record=True) is None
+
+    def test_3d_excluded(self):
+        """Test include_3d=False hides 3D presets."""
+        assert get_preset("abop_1_25", include_3d=False) is None
+        assert get_preset("abop_1_25") is PRESETS_3D["abop_1_25"]
+
+    def test_fast_lookup(self):
+        """Test the lowercased fast path returns what get_preset does."""
+        for name in list_presets():
+            assert get_preset_fast(name.lower()) == get_preset(name)
+        with pytest.raises(KeyError):
+            get_preset_fast("no_such_preset")
+
+
+class TestLazyLoading:
+    """Tests for deferred construction of the 3D and parametric tables."""
+
+    def test_import_builds_2d_only(self):
+        """Test a cold import leaves 3D/parametric tables unbuilt until needed."""
+        code = (
+            "import sys\n"
+            "import lsystem.presets as p\n"
+            "assert 'PRESETS_3D' not in vars(p)\n"
+            "assert 'lsystem._presets_3d' not in sys.modules\n"
+            "assert p.get_preset('dragon_curve') is p.PRESETS_2D['dragon_curve']\n"
+            "assert 'PRESETS_3D' not in vars(p)\n"
+            "assert p.get_preset('oak_param') is not None\n"
+            "assert 'PRESETS_3D' in vars(p)\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        subprocess.run([sys.executable, "-c", code], cwd=root, check=True)
+
+    def test_unknown_attribute(self):
+        """Test the module hook still rejects unknown names."""
+        import lsystem.presets
+        with pytest.raises(AttributeError):
+            lsystem.presets.NO_SUCH_TABLE
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
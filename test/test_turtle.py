@@ -67,6 +67,37 @@ class TestBasicInterpretation:
         assert abs(result.segments[0].x1 - result.segments[2].x1) < 1e-10
         assert result.segments[0].y2 == result.segments[2].y1  # Connected
     
+    def test_branch_restores_state(self):
+        """Test a pop restores heading, width, step size and color."""
+        interp = TurtleInterpreter(angle_delta=45, step_size=10, length_decay=0.5)
+        result = interp.interpret("F[+!'F[-F]F]F")
+        
+        first, last = result.segments[0], result.segments[-1]
+        assert (last.x1, last.y1) == (first.x2, first.y2)
+        assert (last.x2 - last.x1, last.y2 - last.y1) == (first.x2 - first.x1, first.y2 - first.y1)
+        assert (last.depth, last.width, last.color_index) == (0, first.width, 0)
+        assert result.segments[1].length() == pytest.approx(5)
+    
+    def test_run_of_segments(self):
+        """Test a run of F draws one connected segment per symbol."""
+        interp = TurtleInterpreter(angle_delta=45, step_size=10)
+        result = interp.interpret("+FFF-F")
+        
+        assert len(result.segments) == 4
+        assert [seg.index for seg in result.segments] == [0, 1, 2, 3]
+        for prev, seg in zip(result.segments, result.segments[1:]):
+            assert (seg.x1, seg.y1) == (prev.x2, prev.y2)
+        assert abs(result.segments[2].y2 - 30 * math.sin(math.radians(135))) < 1e-9
+    
+    def test_placeholders_ignored(self):
+        """Test placeholder symbols do not change the drawing."""
+        interp = TurtleInterpreter(angle_delta=30, step_size=10)
+        plain = interp.interpret("F[+F]-F{.f.f.}")
+        marked = interp.interpret("XFA[+YF]B-FL{.f.f.}Z")
+        
+        assert marked.segments == plain.segments
+        assert marked.polygons == plain.polygons
+    
     def test_depth_increment(self):
         """Test that depth increments in branches."""
         interp = TurtleInterpreter()
@@ -158,6 +189,97 @@ class TestPolygonMode:
         # But polygon should have vertices
         if result.polygons:
             assert len(result.polygons[0].vertices) >= 3
+    
+    def test_3d_polygon_template(self):
+        """Test templated 3D leaves match symbol-by-symbol interpretation."""
+        from turtle import interpreter3d
+        word = "F[&F{-f+f-|-f+f}]/F{-f(0.5)+f(0.5)-|-f(0.5)+f(0.5)}F"
+        interp = interpreter3d.TurtleInterpreter3D(angle_delta=22.5, step_size=2)
+        templated = interp.interpret(word)
+        # Any random variance disables templates; this little changes no value
+        interp.angle_variance = interp.length_variance = 1e-300
+        stepped = interp.interpret(word)
+        
+        assert len(templated.polygons) == len(stepped.polygons) == 2
+        for a, b in zip(templated.polygons, stepped.polygons):
+            assert len(a.vertices) == len(b.vertices) == 5
+            for va, vb in zip(a.vertices, b.vertices):
+                assert va == pytest.approx(vb)
+        # The turtle continues from the same position and heading
+        last_a, last_b = templated.segments[-1], stepped.segments[-1]
+        assert (last_a.x2, last_a.y2, last_a.z2) == pytest.approx((last_b.x2, last_b.y2, last_b.z2))
+
+
+class TestRotation3D:
+    """Tests for precomputed runs of 3D rotations."""
+    
+    def test_rotation_run_matches_single_turns(self):
+        """Test a fused run of turns matches turning symbol by symbol."""
+        from turtle import interpreter3d
+        word = "F&+(30)/F[^^\\F]|-F+(x)F"
+        interp = interpreter3d.TurtleInterpreter3D(angle_delta=22.5, roll_angle=40, pitch_angle=60)
+        fused = interp.interpret(word)
+        # Any random variance turns one symbol at a time; this little changes no value
+        interp.angle_variance = 1e-300
+        stepped = interp.interpret(word)
+        
+        assert len(fused.segments) == len(stepped.segments) == 5
+        for a, b in zip(fused.segments, stepped.segments):
+            assert (a.x2, a.y2, a.z2) == pytest.approx((b.x2, b.y2, b.z2))
+            assert a.heading == pytest.approx(b.heading)
+
+
+class TestPlaceholders3D:
+    """Tests for placeholder letters stripped before the 3D walk."""
+    
+    def test_exponent_arguments_kept(self):
+        """Test exponent letters in arguments are not taken for placeholders."""
+        from turtle.interpreter3d import TurtleInterpreter3D
+        interp = TurtleInterpreter3D(step_size=10)
+        result = interp.interpret("AF(1e2)BF(2.5E1)!(1e-1)FL")
+        
+        assert [seg.length() for seg in result.segments] == pytest.approx([100, 25, 10])
+        assert result.segments[2].width == pytest.approx(
+            interp.interpret("F(100)F(25)!(0.1)F").segments[2].width)
+
+
+class TestTropism3D:
+    """Tests for the fused 3D tropism step."""
+    
+    def test_bend_frame_matches_separate_steps(self):
+        """Test bending agrees with apply_tropism followed by orthonormalize."""
+        from turtle import interpreter3d
+        state = interpreter3d.TurtleState3D()
+        state.rotate_pitch(30)
+        state.rotate_roll(45)
+        unit = interpreter3d._normalize_py([0.2, -1.0, 0.1])
+        H, L, U = interpreter3d._bend_frame_py(
+            [float(x) for x in state.H], [float(x) for x in state.L], unit, 0.35)
+        
+        if interpreter3d.HAS_NUMPY:
+            unit = interpreter3d._unit_vector_np((0.2, -1.0, 0.1))
+        state.H = interpreter3d.apply_tropism(state.H, unit, 0.35)
+        state.orthonormalize()
+        for fused, separate in ((H, state.H), (L, state.L), (U, state.U)):
+            assert list(fused) == pytest.approx(list(separate))
+    
+    def test_run_of_segments(self):
+        """Test a run of F draws connected segments and bends each with tropism."""
+        from turtle.interpreter3d import TurtleInterpreter3D
+        result = TurtleInterpreter3D(step_size=10).interpret("&FF(2)F")
+    
+        assert [seg.index for seg in result.segments] == [0, 1, 2]
+        for prev, seg in zip(result.segments, result.segments[1:]):
+            assert (seg.x1, seg.y1, seg.z1) == (prev.x2, prev.y2, prev.z2)
+            assert seg.heading == prev.heading
+        assert result.segments[1].length() == pytest.approx(2)
+    
+        bent = TurtleInterpreter3D(
+            step_size=10, tropism_vector=(0, -1, 0), tropism_strength=0.3).interpret("&FF(2)F")
+        assert bent.segments[0].heading == result.segments[0].heading
+        assert bent.segments[1].heading != result.segments[1].heading
+        assert (bent.segments[1].x1, bent.segments[1].y1, bent.segments[1].z1) == (
+            result.segments[1].x1, result.segments[1].y1, result.segments[1].z1)
 
 
 class TestCutBranch:
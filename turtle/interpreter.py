@@ -6,7 +6,8 @@ Supports ABOP (The Algorithmic Beauty of Plants) symbols.
 """
 
 import math
-from dataclasses import dataclass, field
+import string
+from dataclasses import dataclass
 from typing import List, Tuple, Optional, NamedTuple
 
 
@@ -115,40 +116,18 @@ class BoundingBox:
         )
 
 
-@dataclass
-class TurtleState:
-    """Current state of the turtle."""
-    x: float
-    y: float
-    angle: float  # In degrees, 0 = right, 90 = up
-    depth: int
-    width: float
-    step_size: float
-    color_index: int = 0  # For color cycling
-    in_polygon: bool = False  # Whether currently recording polygon vertices
-    polygon_vertices: List[Tuple[float, float]] = field(default_factory=list)
-    
-    def copy(self) -> 'TurtleState':
-        """Create a deep copy of the state."""
-        return TurtleState(
-            x=self.x,
-            y=self.y,
-            angle=self.angle,
-            depth=self.depth,
-            width=self.width,
-            step_size=self.step_size,
-            color_index=self.color_index,
-            in_polygon=self.in_polygon,
-            polygon_vertices=self.polygon_vertices.copy()
-        )
-
-
 class InterpretResult(NamedTuple):
     """Result of interpreting an L-system string."""
     segments: List[Segment]
     polygons: List[Polygon]
 
 
+# Letters the interpreter ignores (X, Y, A, B, ...), deleted before the walk
+_STRIP_PLACEHOLDERS = str.maketrans('', '', ''.join(
+    c for c in string.ascii_letters if c not in 'FfG'
+))
+
+
 class TurtleInterpreter:
     """
     Interprets L-system strings using turtle graphics.
@@ -219,76 +198,59 @@ class TurtleInterpreter:
         segment_index = 0
         polygon_index = 0
         
-        # Initial state: at origin, pointing up (90 degrees)
-        state = TurtleState(
-            x=0.0,
-            y=0.0,
-            angle=90.0,
-            depth=0,
-            width=self.initial_width,
-            step_size=self.step_size,
-            color_index=0,
-            in_polygon=False,
-            polygon_vertices=[]
-        )
+        # Turtle state, kept in locals for the walk; '[' pushes it as a
+        # tuple. Initial state: at origin, pointing up (90 degrees)
+        x = 0.0
+        y = 0.0
+        angle = 90.0
+        depth = 0
+        width = self.initial_width
+        step_size = self.step_size
+        color_index = 0
+        in_polygon = False
+        polygon_vertices = []
+        
+        angle_delta = self.angle_delta
+        width_decay = self.width_decay
+        length_decay = self.length_decay
+        width_decrement = self.width_decrement
+        
+        # Drop placeholder symbols in one C-level pass; they do nothing here
+        lsystem_string = lsystem_string.translate(_STRIP_PLACEHOLDERS)
+        length = len(lsystem_string)
         
         i = 0
-        while i < len(lsystem_string):
+        while i < length:
             char = lsystem_string[i]
             
             if char == 'F':
-                # Move forward and draw
-                rad = math.radians(state.angle)
-                new_x = state.x + state.step_size * math.cos(rad)
-                new_y = state.y + state.step_size * math.sin(rad)
-                
-                # Create segment
-                segment = Segment(
-                    x1=state.x,
-                    y1=state.y,
-                    x2=new_x,
-                    y2=new_y,
-                    depth=state.depth,
-                    width=state.width,
-                    index=segment_index,
-                    color_index=state.color_index
-                )
-                segments.append(segment)
-                segment_index += 1
-                
-                # Update position
-                state.x = new_x
-                state.y = new_y
-                
-            elif char == 'f' or char == 'G':
-                # Move forward without drawing
-                rad = math.radians(state.angle)
-                state.x += state.step_size * math.cos(rad)
-                state.y += state.step_size * math.sin(rad)
-                
-                # In ABOP polygon mode, f movements automatically add vertices
-                if state.in_polygon:
-                    state.polygon_vertices.append((state.x, state.y))
-                
-            elif char == '+':
-                # Turn left (counter-clockwise)
-                state.angle += self.angle_delta
-                
-            elif char == '-':
-                # Turn right (clockwise)
-                state.angle -= self.angle_delta
-                
-            elif char == '|':
-                # Turn around 180 degrees (ABOP symbol)
-                state.angle += 180
+                # Move forward and draw. Rules like F -> FF leave long runs
+                # of F along one heading, so the step is computed once per run
+                rad = math.radians(angle)
+                dx = step_size * math.cos(rad)
+                dy = step_size * math.sin(rad)
+                while True:
+                    new_x = x + dx
+                    new_y = y + dy
+                    segments.append(Segment(
+                        x, y, new_x, new_y, depth, width, segment_index, color_index
+                    ))
+                    segment_index += 1
+                    x = new_x
+                    y = new_y
+                    
+                    if i + 1 < length and lsystem_string[i + 1] == 'F':
+                        i += 1
+                    else:
+                        break
                 
             elif char == '[':
-                # Push state onto stack and increase depth
-                stack.append(state.copy())
-                # Update state for new branch
-                state.depth += 1
-                state.width *= self.width_decay
-                state.step_size *= self.length_decay
+                # Push state onto stack, then update it for the new branch
+                stack.append((x, y, angle, depth, width, step_size, color_index,
+                              in_polygon, polygon_vertices.copy()))
+                depth += 1
+                width *= width_decay
+                step_size *= length_decay
                 
             elif char == ']':
                 # Pop state from stack
@@ -296,57 +258,80 @@ class TurtleInterpreter:
                     # IMPORTANT: Preserve polygon context across push/pop
                     # In ABOP, polygons can span across branches - the polygon
                     # collects vertices as the turtle moves, regardless of push/pop
-                    was_in_polygon = state.in_polygon
-                    polygon_verts = state.polygon_vertices
-                    color_idx = state.color_index
+                    was_in_polygon = in_polygon
+                    polygon_verts = polygon_vertices
+                    color_idx = color_index
                     
-                    state = stack.pop()
+                    (x, y, angle, depth, width, step_size, color_index,
+                     in_polygon, polygon_vertices) = stack.pop()
                     
                     # Restore polygon context if we were recording
                     if was_in_polygon:
-                        state.in_polygon = True
-                        state.polygon_vertices = polygon_verts
-                        state.color_index = color_idx
-                    
+                        in_polygon = True
+                        polygon_vertices = polygon_verts
+                        color_index = color_idx
+                
+            elif char == '+':
+                # Turn left (counter-clockwise)
+                angle += angle_delta
+                
+            elif char == '-':
+                # Turn right (clockwise)
+                angle -= angle_delta
+                
+            elif char == 'f' or char == 'G':
+                # Move forward without drawing
+                rad = math.radians(angle)
+                x += step_size * math.cos(rad)
+                y += step_size * math.sin(rad)
+                
+                # In ABOP polygon mode, f movements automatically add vertices
+                if in_polygon:
+                    polygon_vertices.append((x, y))
+                
+            elif char == '|':
+                # Turn around 180 degrees (ABOP symbol)
+                angle += 180
+                
             elif char == '!':
                 # Decrement diameter (ABOP width control)
-                state.width *= self.width_decrement
+                width *= width_decrement
                 
             elif char == "'":
                 # Increment color index
-                state.color_index += 1
+                color_index += 1
                 
             elif char == '{':
                 # Start polygon mode - add current position as first vertex (ABOP style)
-                state.in_polygon = True
-                state.polygon_vertices = [(state.x, state.y)]
+                in_polygon = True
+                polygon_vertices = [(x, y)]
                 
             elif char == '}':
                 # End polygon mode
-                if state.in_polygon:
+                if in_polygon:
                     # Close and store polygon
                     poly = Polygon(
-                        vertices=state.polygon_vertices.copy(),
-                        depth=state.depth,
-                        color_index=state.color_index,
+                        vertices=polygon_vertices.copy(),
+                        depth=depth,
+                        color_index=color_index,
                         index=polygon_index
                     )
                     if poly.is_valid():
                         polygons.append(poly)
                         polygon_index += 1
-                    state.in_polygon = False
-                    state.polygon_vertices = []
+                    in_polygon = False
+                    polygon_vertices = []
                     
             elif char == '.':
                 # Mark current position as polygon vertex
-                if state.in_polygon:
-                    state.polygon_vertices.append((state.x, state.y))
+                if in_polygon:
+                    polygon_vertices.append((x, y))
                     
             elif char == '%':
                 # Cut off remainder of branch - skip to matching ]
                 bracket_depth = 1
                 i += 1
-                while i < len(lsystem_string) and bracket_depth > 0:
+                while i < length and bracket_depth > 0:
                     if lsystem_string[i] == '[':
                         bracket_depth += 1
                     elif lsystem_string[i] == ']':
@@ -7,7 +7,10 @@ Implements the HLU (Heading, Left, Up) orientation system with ABOP enhancements
 
 import math
 import random
+import re
+import string
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List, Tuple, Optional, NamedTuple
 
 # Try to use numpy for faster computation, fall back to pure Python
@@ -57,12 +60,17 @@ def _mat_vec_mul_py(m: List[List[float]], v: List[float]) -> List[float]:
     ]
 
 
+@lru_cache(maxsize=256)
+def _cos_sin(angle_deg: float) -> Tuple[float, float]:
+    """Cosine and sine of an angle in degrees; presets turn by a few fixed angles."""
+    angle = math.radians(angle_deg)
+    return math.cos(angle), math.sin(angle)
+
+
 def _rotation_matrix_py(axis: List[float], angle_deg: float) -> List[List[float]]:
     """Create rotation matrix for rotation around arbitrary axis (pure Python)."""
     axis = _normalize_py(axis)
-    angle = math.radians(angle_deg)
-    c = math.cos(angle)
-    s = math.sin(angle)
+    c, s = _cos_sin(angle_deg)
     t = 1 - c
     x, y, z = axis
     
@@ -77,13 +85,25 @@ def _rotation_matrix_py(axis: List[float], angle_deg: float) -> List[List[float]
 # NumPy 3D Math (faster)
 # =============================================================================
 
+# np.cross and np.linalg.norm carry general-shape overhead that dominates
+# for single 3-vectors; these do the same float operations directly
+
+def _cross_np(a, b):
+    """Cross product of two 3-vectors, same result as np.cross."""
+    return np.array(_cross_py(a, b))
+
+
+def _norm_np(v) -> float:
+    """Euclidean length of a 1-D vector, same result as np.linalg.norm."""
+    return math.sqrt(v.dot(v))
+
+
 def _rotation_matrix_np(axis, angle_deg: float):
     """Create rotation matrix for rotation around arbitrary axis (numpy)."""
-    axis = axis / np.linalg.norm(axis)
-    angle = np.radians(angle_deg)
-    c, s = np.cos(angle), np.sin(angle)
+    # Scalar math on Python floats; numpy scalar ops are slower per call
+    x, y, z = (axis / _norm_np(axis)).tolist()
+    c, s = _cos_sin(angle_deg)
     t = 1 - c
-    x, y, z = axis
     return np.array([
         [t*x*x + c,    t*x*y - s*z,  t*x*z + s*y],
         [t*x*y + s*z,  t*y*y + c,    t*y*z - s*x],
@@ -297,10 +317,10 @@ class TurtleState3D:
             # L should be orthogonal to H
             # Project L onto the horizontal plane (perpendicular to gravity)
             # New L = H Ãƒâ€” gravity (normalized)
-            new_L = np.cross(self.H, -gravity)
-            if np.linalg.norm(new_L) > 1e-6:
-                self.L = new_L / np.linalg.norm(new_L)
-                self.U = np.cross(self.H, self.L)
+            new_L = _cross_np(self.H, -gravity)
+            if _norm_np(new_L) > 1e-6:
+                self.L = new_L / _norm_np(new_L)
+                self.U = _cross_np(self.H, self.L)
         else:
             # H Ãƒâ€” gravity
             new_L = _cross_py(self.H, [-g for g in gravity])
@@ -312,10 +332,10 @@ class TurtleState3D:
     def orthonormalize(self) -> None:
         """Re-orthonormalize HLU vectors to prevent numerical drift."""
         if self.use_numpy:
-            self.H = self.H / np.linalg.norm(self.H)
+            self.H = self.H / _norm_np(self.H)
             self.L = self.L - np.dot(self.H, self.L) * self.H
-            self.L = self.L / np.linalg.norm(self.L)
-            self.U = np.cross(self.H, self.L)
+            self.L = self.L / _norm_np(self.L)
+            self.U = _cross_np(self.H, self.L)
         else:
             self.H = _normalize_py(self.H)
             proj = _dot_py(self.H, self.L)
@@ -345,6 +365,120 @@ class TurtleState3D:
         return new_state
 
 
+@lru_cache(maxsize=32)
+def _unit_vector_np(vector: Tuple[float, float, float]):
+    """
+    Normalized, read-only numpy copy of a direction tuple.
+    
+    Presets share a handful of tropism directions, so each is converted
+    and normalized once and the frozen array is reused.
+    """
+    unit = np.array(vector, dtype=float)
+    unit = unit / np.linalg.norm(unit)
+    unit.setflags(write=False)
+    return unit
+
+
+# A polygon drawn only with plain turns and moves, e.g. the leaf "{-f+f-|-f+f}"
+_POLYGON_TEMPLATE_RE = re.compile(r"\{((?:[-+|]|f(?:\([^()]*\))?)*)\}")
+
+
+@lru_cache(maxsize=64)
+def _polygon_template(body: str, angle_delta: float):
+    """
+    Precompute a polygon template in the turtle's own frame.
+    
+    Yaw turns keep the heading in the H-L plane, so every move direction
+    and the final frame are fixed combinations of the starting H and L.
+    The template is traced once on the initial frame and reused for every
+    polygon with the same body.
+    
+    Returns:
+        (moves, heading, left): moves as (h, l, step) with step None for the
+        state's step size; heading and left as (h, l) coefficient pairs.
+        None if a move argument is not a number.
+    """
+    state = TurtleState3D(use_numpy=False)
+    H0, L0 = state.H, state.L
+    
+    def coefficients(v):
+        return (_dot_py(v, H0), _dot_py(v, L0))
+    
+    moves = []
+    for turn, step in re.findall(r"([-+|])|f(?:\(([^()]*)\))?", body):
+        if turn == '+':
+            state.rotate_yaw(angle_delta)
+        elif turn == '-':
+            state.rotate_yaw(-angle_delta)
+        elif turn == '|':
+            state.turn_around()
+        else:
+            try:
+                step = float(step.strip()) if step else None
+            except ValueError:
+                return None
+            moves.append(coefficients(state.H) + (step,))
+    return tuple(moves), coefficients(state.H), coefficients(state.L)
+
+
+# Letters the interpreter ignores (A, B, L, ...), deleted before the walk.
+# Ones followed by an argument list are kept: dropping only the letter would
+# hand its argument to the preceding symbol, e.g. "+A(30)" -> "+(30)".
+# Argument lists are matched first and kept whole (group 1), so exponent
+# letters such as the e in "F(1e2)" are never taken for placeholders.
+_PLACEHOLDER_RE = re.compile('(\\([^)]*\\))|[%s](?!\\()' % ''.join(
+    c for c in string.ascii_letters if c not in 'FfGT'
+))
+
+# A rotation symbol with an optional angle argument, and a run of them
+_ROTATION = r"[-+&^/\\](?:\([^()]*\))?|\|"
+_ROTATION_RE = re.compile(_ROTATION)
+_ROTATION_RUN_RE = re.compile(f"(?:{_ROTATION})+")
+
+
+@lru_cache(maxsize=256)
+def _rotation_run(run: str, angle_delta: float, pitch_angle: float, roll_angle: float):
+    """
+    Precompute the frame change of a run of consecutive rotations.
+    
+    Every rotation turns about one of the turtle's own axes, so the frame
+    after the run is a fixed combination of the starting H, L and U. The
+    run is traced once on the initial frame and the combination reused
+    wherever the same run appears.
+    
+    Returns:
+        (heading, left, up) as (h, l, u) coefficient triples, or None if
+        an angle argument is not a number
+    """
+    state = TurtleState3D(use_numpy=False)
+    H0, L0, U0 = state.H, state.L, state.U
+    
+    for token in _ROTATION_RE.findall(run):
+        symbol, angle = token[0], token[2:-1]
+        try:
+            angle = float(angle.strip()) if angle else None
+        except ValueError:
+            return None
+        if symbol == '+':
+            state.rotate_yaw(angle_delta if angle is None else angle)
+        elif symbol == '-':
+            state.rotate_yaw(-(angle_delta if angle is None else angle))
+        elif symbol == '&':
+            state.rotate_pitch(-(pitch_angle if angle is None else angle))
+        elif symbol == '^':
+            state.rotate_pitch(pitch_angle if angle is None else angle)
+        elif symbol == '\\':
+            state.rotate_roll(-(roll_angle if angle is None else angle))
+        elif symbol == '/':
+            state.rotate_roll(roll_angle if angle is None else angle)
+        else:
+            state.turn_around()
+    return tuple(
+        (_dot_py(v, H0), _dot_py(v, L0), _dot_py(v, U0))
+        for v in (state.H, state.L, state.U)
+    )
+
+
 def apply_tropism(heading, tropism_vector, elasticity: float = 0.2):
     """
     Bend heading toward tropism direction.
@@ -363,7 +497,7 @@ def apply_tropism(heading, tropism_vector, elasticity: float = 0.2):
         # H' = normalize(H + e * (T - (TÃ‚Â·H)H))
         dot = np.dot(tropism_vector, heading)
         bent = heading + elasticity * (tropism_vector - dot * heading)
-        return bent / np.linalg.norm(bent)
+        return bent / _norm_np(bent)
     else:
         dot = _dot_py(tropism_vector, heading)
         bent = [heading[i] + elasticity * (tropism_vector[i] - dot * heading[i]) 
@@ -371,6 +505,26 @@ def apply_tropism(heading, tropism_vector, elasticity: float = 0.2):
         return _normalize_py(bent)
 
 
+def _bend_frame_py(H, L, tropism_vector, elasticity: float):
+    """
+    Apply tropism to H, then re-orthonormalize the frame (pure Python).
+    
+    Same steps as apply_tropism followed by TurtleState3D.orthonormalize,
+    fused on Python floats: for 3-vectors this is several times faster
+    than the per-call overhead of the equivalent numpy operations.
+    
+    Returns:
+        (H, L, U) as lists
+    """
+    dot = _dot_py(tropism_vector, H)
+    H = _normalize_py([H[i] + elasticity * (tropism_vector[i] - dot * H[i])
+                       for i in range(3)])
+    H = _normalize_py(H)
+    proj = _dot_py(H, L)
+    L = _normalize_py([L[i] - proj * H[i] for i in range(3)])
+    return H, L, _cross_py(H, L)
+
+
 class InterpretResult3D(NamedTuple):
     """Result of interpreting a 3D L-system string."""
     segments: List[Segment3D]
@@ -458,8 +612,7 @@ class TurtleInterpreter3D:
         self.tropism_strength = tropism_strength
         if tropism_vector is not None:
             if HAS_NUMPY:
-                self.tropism_vector = np.array(tropism_vector, dtype=float)
-                self.tropism_vector = self.tropism_vector / np.linalg.norm(self.tropism_vector)
+                self.tropism_vector = _unit_vector_np(tuple(tropism_vector))
             else:
                 self.tropism_vector = _normalize_py(list(tropism_vector))
         else:
@@ -510,6 +663,23 @@ class TurtleInterpreter3D:
         state = TurtleState3D(use_numpy=HAS_NUMPY)
         state.width = self.initial_width
         state.step_size = self.step_size
+        # Templates assume exact turns and steps, so not with random variance
+        instance_polygons = self.angle_variance == 0 and self.length_variance == 0
+        rotation_runs = '+-&^\\/|' if self.angle_variance == 0 else ''
+        
+        # Tropism direction as plain floats; None when there is none
+        direction = self.tropism_vector
+        if HAS_NUMPY and direction is not None:
+            direction = direction.tolist()
+        tropism = direction if self.tropism_strength > 0 else None
+        
+        def bend_frame(state: TurtleState3D, strength: float):
+            """Bend the heading toward the tropism direction and fix up L and U."""
+            if HAS_NUMPY:
+                H, L, U = _bend_frame_py(state.H.tolist(), state.L.tolist(), direction, strength)
+                state.H, state.L, state.U = np.array(H), np.array(L), np.array(U)
+            else:
+                state.H, state.L, state.U = _bend_frame_py(state.H, state.L, direction, strength)
         
         def extract_param(s: str, pos: int) -> Tuple[Optional[float], int]:
             """
@@ -542,51 +712,55 @@ class TurtleInterpreter3D:
             except ValueError:
                 return None, pos
         
+        lsystem_string = _PLACEHOLDER_RE.sub(r'\1', lsystem_string)
+        
         i = 0
-        while i < len(lsystem_string):
+        length = len(lsystem_string)
+        while i < length:
             char = lsystem_string[i]
             
             if char == 'F':
-                # Move forward and draw - check for parameter
-                param, new_i = extract_param(lsystem_string, i + 1)
-                if param is not None:
-                    step = self._vary_length(param)
-                    i = new_i
-                else:
-                    step = self._vary_length(state.step_size)
-                
+                # Move forward and draw. Without tropism a run of F keeps
+                # its heading, so the run advances on plain floats
                 if HAS_NUMPY:
-                    new_pos = state.position + step * state.H
-                    segment = Segment3D(
-                        x1=state.position[0], y1=state.position[1], z1=state.position[2],
-                        x2=new_pos[0], y2=new_pos[1], z2=new_pos[2],
-                        depth=state.depth,
-                        width=state.width,
-                        index=segment_index,
-                        heading=tuple(state.H),
-                        color_index=state.color_index
-                    )
-                    state.position = new_pos
+                    x, y, z = state.position.tolist()
+                    heading = tuple(state.H.tolist())
                 else:
-                    new_pos = [state.position[j] + step * state.H[j] for j in range(3)]
-                    segment = Segment3D(
-                        x1=state.position[0], y1=state.position[1], z1=state.position[2],
-                        x2=new_pos[0], y2=new_pos[1], z2=new_pos[2],
+                    x, y, z = state.position
+                    heading = tuple(state.H)
+                hx, hy, hz = heading
+                while True:
+                    # Check for parameter
+                    param, new_i = extract_param(lsystem_string, i + 1)
+                    if param is not None:
+                        step = self._vary_length(param)
+                        i = new_i
+                    else:
+                        step = self._vary_length(state.step_size)
+                    
+                    x2 = x + step * hx
+                    y2 = y + step * hy
+                    z2 = z + step * hz
+                    segments.append(Segment3D(
+                        x1=x, y1=y, z1=z,
+                        x2=x2, y2=y2, z2=z2,
                         depth=state.depth,
                         width=state.width,
                         index=segment_index,
-                        heading=tuple(state.H),
+                        heading=heading,
                         color_index=state.color_index
-                    )
-                    state.position = new_pos
-                
-                segments.append(segment)
-                segment_index += 1
+                    ))
+                    segment_index += 1
+                    x, y, z = x2, y2, z2
+                    
+                    if tropism is not None or i + 1 >= length or lsystem_string[i + 1] != 'F':
+                        break
+                    i += 1
+                state.position = np.array([x, y, z]) if HAS_NUMPY else [x, y, z]
                 
                 # Apply tropism after movement
-                if self.tropism_strength > 0 and self.tropism_vector is not None:
-                    state.H = apply_tropism(state.H, self.tropism_vector, self.tropism_strength)
-                    state.orthonormalize()
+                if tropism is not None:
+                    bend_frame(state, self.tropism_strength)
                 
             elif char == 'f' or char == 'G':
                 # Move forward without drawing - check for parameter
@@ -604,10 +778,34 @@ class TurtleInterpreter3D:
                 # In ABOP polygon mode, f movements automatically add vertices
                 if state.in_polygon:
                     if HAS_NUMPY:
-                        state.polygon_vertices.append(tuple(state.position))
+                        state.polygon_vertices.append(tuple(state.position.tolist()))
                     else:
                         state.polygon_vertices.append(tuple(state.position))
                 
+            elif char in rotation_runs:
+                # A run of turns at once, from its precomputed frame change
+                run = _ROTATION_RUN_RE.match(lsystem_string, i).group()
+                rotation = _rotation_run(run, self.angle_delta, self.pitch_angle, self.roll_angle)
+                if rotation is None:
+                    # An angle that is not a number: one symbol at a time,
+                    # which turns by the default angle as below
+                    run = _ROTATION_RE.match(lsystem_string, i).group()
+                    rotation = _rotation_run(run, self.angle_delta, self.pitch_angle, self.roll_angle)
+                    if rotation is None:
+                        run = char
+                        rotation = _rotation_run(run, self.angle_delta, self.pitch_angle, self.roll_angle)
+                if HAS_NUMPY:
+                    H, L, U = state.H.tolist(), state.L.tolist(), state.U.tolist()
+                else:
+                    H, L, U = state.H, state.L, state.U
+                frame = [[h * H[j] + l * L[j] + u * U[j] for j in range(3)]
+                         for h, l, u in rotation]
+                if HAS_NUMPY:
+                    state.H, state.L, state.U = np.array(frame)
+                else:
+                    state.H, state.L, state.U = frame
+                i += len(run) - 1
+                
             elif char == '+':
                 # Turn left (positive yaw) - check for parameter
                 param, new_i = extract_param(lsystem_string, i + 1)
@@ -667,8 +865,13 @@ class TurtleInterpreter3D:
                 state.turn_around()
                 
             elif char == '[':
-                # Push state onto stack
-                stack.append(state.copy())
+                # Push a snapshot of the state: the vectors are replaced,
+                # never modified in place, so they are shared, not copied
+                stack.append((
+                    state.position, state.H, state.L, state.U,
+                    state.depth, state.width, state.step_size, state.color_index,
+                    state.in_polygon, state.polygon_vertices.copy()
+                ))
                 state.depth += 1
                 state.width *= self.width_decay
                 state.step_size *= self.length_decay
@@ -683,7 +886,9 @@ class TurtleInterpreter3D:
                     polygon_verts = state.polygon_vertices
                     color_idx = state.color_index
                     
-                    state = stack.pop()
+                    (state.position, state.H, state.L, state.U,
+                     state.depth, state.width, state.step_size, state.color_index,
+                     state.in_polygon, state.polygon_vertices) = stack.pop()
                     
                     # Restore polygon context if we were recording
                     if was_in_polygon:
@@ -711,8 +916,7 @@ class TurtleInterpreter3D:
                 if param is not None:
                     # Apply tropism with specified strength
                     if self.tropism_vector is not None:
-                        state.H = apply_tropism(state.H, self.tropism_vector, param)
-                        state.orthonormalize()
+                        bend_frame(state, param)
                     i = new_i
                 
             elif char == "'":
@@ -720,12 +924,58 @@ class TurtleInterpreter3D:
                 state.color_index += 1
                 
             elif char == '{':
-                # Start polygon mode - add current position as first vertex (ABOP style)
-                state.in_polygon = True
-                if HAS_NUMPY:
-                    state.polygon_vertices = [tuple(state.position)]
+                template = None
+                if instance_polygons:
+                    match = _POLYGON_TEMPLATE_RE.match(lsystem_string, i)
+                    if match:
+                        template = _polygon_template(match.group(1), self.angle_delta)
+                if template:
+                    # Whole polygon from a precomputed template instead of
+                    # turning and moving symbol by symbol
+                    moves, heading, left = template
+                    if HAS_NUMPY:
+                        H, L = state.H.tolist(), state.L.tolist()
+                        x, y, z = state.position.tolist()
+                    else:
+                        H, L = state.H, state.L
+                        x, y, z = state.position
+                    vertices = [(x, y, z)]
+                    for h, l, step in moves:
+                        if step is None:
+                            step = state.step_size
+                        x += step * (h * H[0] + l * L[0])
+                        y += step * (h * H[1] + l * L[1])
+                        z += step * (h * H[2] + l * L[2])
+                        vertices.append((x, y, z))
+                    new_H = [heading[0] * H[j] + heading[1] * L[j] for j in range(3)]
+                    new_L = [left[0] * H[j] + left[1] * L[j] for j in range(3)]
+                    if HAS_NUMPY:
+                        state.position = np.array([x, y, z])
+                        state.H, state.L = np.array(new_H), np.array(new_L)
+                    else:
+                        state.position = [x, y, z]
+                        state.H, state.L = new_H, new_L
+                    
+                    poly = Polygon3D(
+                        vertices=vertices,
+                        depth=state.depth,
+                        color_index=state.color_index,
+                        index=polygon_index
+                    )
+                    if poly.is_valid():
+                        poly.normal = poly.calculate_normal()
+                        polygons.append(poly)
+                        polygon_index += 1
+                    state.in_polygon = False
+                    state.polygon_vertices = []
+                    i = match.end() - 1
                 else:
-                    state.polygon_vertices = [tuple(state.position)]
+                    # Start polygon mode - add current position as first vertex (ABOP style)
+                    state.in_polygon = True
+                    if HAS_NUMPY:
+                        state.polygon_vertices = [tuple(state.position.tolist())]
+                    else:
+                        state.polygon_vertices = [tuple(state.position)]
                     
             elif char == '}':
                 # End polygon mode
@@ -747,7 +997,7 @@ class TurtleInterpreter3D:
                 # Mark current position as polygon vertex
                 if state.in_polygon:
                     if HAS_NUMPY:
-                        state.polygon_vertices.append(tuple(state.position))
+                        state.polygon_vertices.append(tuple(state.position.tolist()))
                     else:
                         state.polygon_vertices.append(tuple(state.position))
                         